@@ -6,20 +6,14 @@ This script provides a command-line interface to customize resumes using Google
 
 import sys
 import argparse
-from pathlib import Path
-from src.app import ResumeCustomizer
+import logging
 
+# Shared with the package so CLI output stays in order with its status messages
+logger = logging.getLogger("resume_customizer")
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="Customize your resume for specific job descriptions using AI"
-    )
 
-    # Add subcommands
-    subparsers = parser.add_subparsers(dest="command", help="Commands")
-
-    # Customize command
-    customize_parser = subparsers.add_parser("customize", help="Customize a resume")
+def p_customize(customize_parser):
+    """Register the arguments of the ``customize`` command."""
     customize_parser.add_argument(
         "resume", help="Path to your current resume (txt, pdf, or docx)"
     )
@@ -51,28 +45,275 @@ def main():
     customize_parser.add_argument(
         "--no-save-latex", action="store_true", help="Do not save the LaTeX source code"
     )
+    customize_parser.add_argument(
+        "--two-pass",
+        action="store_true",
+        help="Run a second validation pass (slower, doubles API usage)",
+    )
     customize_parser.add_argument(
         "--single-pass",
         action="store_true",
-        help="Use single-pass generation (faster but less validation)",
+        help="Use single-pass generation (the default; overrides --two-pass)",
+    )
+    customize_parser.add_argument(
+        "--docx-via-latex",
+        action="store_true",
+        help="Build DOCX output from LaTeX with pandoc instead of directly",
+    )
+    customize_parser.add_argument(
+        "--semantic-cache",
+        action="store_true",
+        help="Reuse output generated for a near-identical resume and job "
+        "description (requires sentence-transformers)",
+    )
+    customize_parser.add_argument(
+        "--response-cache",
+        action="store_true",
+        help="Answer identical Gemini prompts from a local cache (fast retries)",
+    )
+
+
+def p_customize_batch(batch_parser):
+    """Register the arguments of the ``customize-batch`` command."""
+    batch_parser.add_argument(
+        "jobs_dir",
+        help="Directory with one subdirectory per job, each containing a "
+        "resume.{txt,pdf,docx} file and a job.{txt,pdf,docx} description",
+    )
+    batch_parser.add_argument("output_dir", help="Directory for the output files")
+    batch_parser.add_argument(
+        "--format",
+        "-f",
+        choices=["pdf", "docx", "tex"],
+        default="pdf",
+        help="Output format (default: pdf; docx is converted with pandoc)",
+    )
+    batch_parser.add_argument(
+        "--api-key",
+        "-k",
+        help="Google Gemini API key (or set GEMINI_API_KEY env variable)",
+    )
+    batch_parser.add_argument(
+        "--model",
+        "-m",
+        default="gemini-2.0-flash-exp",
+        help="Gemini model to use (default: gemini-2.0-flash-exp)",
+    )
+    batch_parser.add_argument(
+        "--instructions", "-i", help="Additional custom instructions for the AI"
+    )
+    batch_parser.add_argument(
+        "--no-save-latex", action="store_true", help="Do not save the LaTeX source code"
+    )
+    batch_parser.add_argument(
+        "--timeout",
+        type=float,
+        help="Maximum seconds to wait for the batch job (default: no limit)",
+    )
+
+
+def p_customize_many(many_parser):
+    """Register the arguments of the ``customize-many`` command."""
+    many_parser.add_argument(
+        "jobs_file",
+        help='JSON file with a list of {"resume": ..., "job_description": ..., '
+        '"output": ...} objects',
+    )
+    many_parser.add_argument(
+        "--format",
+        "-f",
+        choices=["pdf", "docx", "tex"],
+        default="pdf",
+        help="Output format (default: pdf)",
+    )
+    many_parser.add_argument(
+        "--api-key",
+        "-k",
+        help="Google Gemini API key (or set GEMINI_API_KEY env variable)",
+    )
+    many_parser.add_argument(
+        "--model",
+        "-m",
+        default="gemini-2.0-flash-exp",
+        help="Gemini model to use (default: gemini-2.0-flash-exp)",
+    )
+    many_parser.add_argument(
+        "--instructions", "-i", help="Additional custom instructions for the AI"
+    )
+    many_parser.add_argument(
+        "--no-save-latex", action="store_true", help="Do not save the LaTeX source code"
+    )
+    many_parser.add_argument(
+        "--concurrency",
+        "-c",
+        type=int,
+        default=4,
+        help="Maximum concurrent Gemini requests; keep within your API rate limit "
+        "(default: 4)",
+    )
+    many_parser.add_argument(
+        "--docx-via-latex",
+        action="store_true",
+        help="Build DOCX output from LaTeX with pandoc instead of directly",
     )
 
-    # Check command
-    check_parser = subparsers.add_parser("check", help="Check system requirements")
+
+def p_check(check_parser):
+    """Register the arguments of the ``check`` command."""
     check_parser.add_argument("--api-key", "-k", help="Google Gemini API key to verify")
 
+
+# Subcommand name -> (help text, argument builder)
+COMMANDS = {
+    "customize": ("Customize a resume", p_customize),
+    "customize-batch": (
+        "Customize many resumes in one Gemini Batch API job",
+        p_customize_batch,
+    ),
+    "customize-many": (
+        "Customize many resumes with concurrent API calls",
+        p_customize_many,
+    ),
+    "check": ("Check system requirements", p_check),
+}
+
+
+def build_parser(argv=None):
+    """
+    Build the CLI parser.
+
+    Only the subcommand named in ``argv`` gets its arguments registered; when
+    no known subcommand is given (e.g. ``--help``) every subcommand is built.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    parser = argparse.ArgumentParser(
+        description="Customize your resume for specific job descriptions using AI"
+    )
+
+    # Add subcommands
+    subparsers = parser.add_subparsers(dest="command", help="Commands")
+
+    selected = argv[0] if argv and argv[0] in COMMANDS else None
+    for name, (help_text, build) in COMMANDS.items():
+        if selected is None or name == selected:
+            build(subparsers.add_parser(name, help=help_text))
+
+    return parser
+
+
+def configure_logging():
+    """
+    Write status messages to stdout from a background thread.
+
+    Callers only put records on a queue; a QueueListener does the actual
+    (possibly slow) terminal writes, so worker threads never block on them.
+    Any records still queued are written at exit.
+    """
+    import atexit
+    import queue
+    from logging.handlers import QueueHandler, QueueListener
+
+    log_queue = queue.Queue(-1)
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = QueueListener(log_queue, handler)
+
+    logger.addHandler(QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    listener.start()
+    atexit.register(listener.stop)
+
+
+def find_batch_jobs(jobs_dir, output_dir, output_format):
+    """
+    Collect the jobs of a ``customize-batch`` run.
+
+    Every subdirectory of ``jobs_dir`` that contains a ``resume.*`` and a
+    ``job.*`` file becomes one job, written to ``output_dir/<subdir>.<format>``.
+    """
+    from pathlib import Path
+
+    jobs = []
+    for job_dir in sorted(Path(jobs_dir).iterdir()):
+        if not job_dir.is_dir():
+            continue
+        resumes = sorted(job_dir.glob("resume.*"))
+        descriptions = sorted(job_dir.glob("job.*"))
+        if not resumes or not descriptions:
+            logger.warning(f"⚠️  Skipping {job_dir}: needs a resume.* and a job.* file")
+            continue
+        jobs.append(
+            {
+                "resume_path": str(resumes[0]),
+                "job_description": str(descriptions[0]),
+                "output_path": str(
+                    Path(output_dir) / f"{job_dir.name}.{output_format}"
+                ),
+            }
+        )
+    return jobs
+
+
+def load_many_jobs(jobs_file):
+    """Read the job list of a ``customize-many`` run from a JSON file."""
+    import json
+
+    with open(jobs_file, "r", encoding="utf-8") as f:
+        entries = json.load(f)
+
+    return [
+        {
+            "resume_path": entry["resume"],
+            "job_description": entry["job_description"],
+            "output_path": entry["output"],
+        }
+        for entry in entries
+    ]
+
+
+def report_many(jobs, results):
+    """Print the outcome of a multi-job run and exit non-zero on any failure."""
+    failed = 0
+    for job, result in zip(jobs, results):
+        if result.success:
+            logger.info(f"✅ {result.output_file}")
+        else:
+            failed += 1
+            logger.error(f"❌ {job['resume_path']}: {result.error}")
+
+    logger.info(f"\n{len(results) - failed}/{len(results)} resumes generated")
+    if failed:
+        sys.exit(1)
+
+
+def main():
+    parser = build_parser()
     args = parser.parse_args()
 
     if not args.command:
         parser.print_help()
         return
 
+    configure_logging()
+
     if args.command == "customize":
+        from src.app import ResumeCustomizer
+
         # Create customizer instance
-        customizer = ResumeCustomizer(
-            api_key=args.api_key if hasattr(args, "api_key") else None,
-            model=args.model if hasattr(args, "model") else "gemini-2.0-flash-exp",
-        )
+        try:
+            customizer = ResumeCustomizer(
+                api_key=args.api_key,
+                model=args.model,
+                use_semantic_cache=args.semantic_cache,
+                use_response_cache=args.response_cache,
+            )
+        except ImportError as e:
+            logger.error(f"\n❌ Failed: {e}")
+            sys.exit(1)
 
         # Customize resume
         result = customizer.customize_resume(
@@ -80,35 +321,75 @@ def main():
             job_description=args.job_description,
             output_path=args.output,
             output_format=args.format,
-            custom_instructions=(
-                args.instructions if hasattr(args, "instructions") else None
-            ),
-            save_latex=(
-                not args.no_save_latex if hasattr(args, "no_save_latex") else True
-            ),
-            two_pass=not args.single_pass if hasattr(args, "single_pass") else True,
+            custom_instructions=args.instructions,
+            save_latex=not args.no_save_latex,
+            two_pass=args.two_pass and not args.single_pass,
+            docx_via_latex=args.docx_via_latex,
         )
 
-        if result["success"]:
-            print("\n✅ Success!")
-            print(f"📄 Output file: {result['output_file']}")
-            if result["latex_file"]:
-                print(f"📝 LaTeX source: {result['latex_file']}")
+        if result.success:
+            logger.info("\n✅ Success!")
+            logger.info(f"📄 Output file: {result.output_file}")
+            if result.latex_file:
+                logger.info(f"📝 LaTeX source: {result.latex_file}")
         else:
-            print(f"\n❌ Failed: {result['error']}")
+            logger.error(f"\n❌ Failed: {result.error}")
+            sys.exit(1)
+
+    elif args.command == "customize-batch":
+        from src.app import ResumeCustomizer
+
+        try:
+            jobs = find_batch_jobs(args.jobs_dir, args.output_dir, args.format)
+        except OSError as e:
+            logger.error(f"\n❌ Failed: could not read jobs from {args.jobs_dir}: {e}")
             sys.exit(1)
+        if not jobs:
+            logger.error(f"\n❌ Failed: no jobs found in {args.jobs_dir}")
+            sys.exit(1)
+
+        customizer = ResumeCustomizer(api_key=args.api_key, model=args.model)
+        results = customizer.customize_batch(
+            jobs,
+            output_format=args.format,
+            custom_instructions=args.instructions,
+            save_latex=not args.no_save_latex,
+            timeout=args.timeout,
+        )
+
+        report_many(jobs, results)
+
+    elif args.command == "customize-many":
+        from src.app import ResumeCustomizer
+
+        try:
+            jobs = load_many_jobs(args.jobs_file)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.error(f"\n❌ Failed: could not read jobs from {args.jobs_file}: {e}")
+            sys.exit(1)
+
+        customizer = ResumeCustomizer(api_key=args.api_key, model=args.model)
+        results = customizer.customize_many(
+            jobs,
+            output_format=args.format,
+            custom_instructions=args.instructions,
+            save_latex=not args.no_save_latex,
+            max_concurrency=args.concurrency,
+            docx_via_latex=args.docx_via_latex,
+        )
+        report_many(jobs, results)
 
     elif args.command == "check":
+        from src.app import ResumeCustomizer
+
         # Check system requirements
-        customizer = ResumeCustomizer(
-            api_key=args.api_key if hasattr(args, "api_key") else None
-        )
+        customizer = ResumeCustomizer(api_key=args.api_key)
         status = customizer.check_system_requirements()
 
         if status["all_ready"]:
-            print("\n✅ All requirements met! You're ready to go.")
+            logger.info("\n✅ All requirements met! You're ready to go.")
         else:
-            print("\n⚠️  Some requirements are missing. See notes above.")
+            logger.warning("\n⚠️  Some requirements are missing. See notes above.")
             sys.exit(1)
 
 
@@ -2,8 +2,27 @@
 
 __version__ = "0.1.0"
 
-from .gemini_client import GeminiResumeGenerator
-from .resume_parser import ResumeParser
-from .latex_converter import LaTeXConverter
-
 __all__ = ["GeminiResumeGenerator", "ResumeParser", "LaTeXConverter"]
+
+# Submodules are imported on first attribute access (PEP 562) so that importing
+# the package does not pull in google-genai, pypandoc and the PDF/DOCX readers.
+_LAZY_EXPORTS = {
+    "GeminiResumeGenerator": ".gemini_client",
+    "ResumeParser": ".resume_parser",
+    "LaTeXConverter": ".latex_converter",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        import importlib
+
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_EXPORTS))
@@ -1,17 +1,73 @@
 """Main application logic for resume customization."""
 
+import asyncio
+import functools
+import logging
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Literal, Optional, Union
-from .gemini_client import GeminiResumeGenerator
-from .resume_parser import ResumeParser
-from .latex_converter import LaTeXConverter
+from typing import TYPE_CHECKING, List, Literal, Optional, Union
+
+if TYPE_CHECKING:
+    from .gemini_client import GeminiResumeGenerator
+    from .latex_converter import LaTeXConverter
+    from .resume_parser import ResumeParser
+
+# Status messages; the CLI sends them to stdout
+logger = logging.getLogger("resume_customizer")
+
+# Resume/job description embedding similarity above which the resume is
+# already a close match and the two-pass validation call is skipped
+ALIGNMENT_SKIP_THRESHOLD = 0.85
+
+
+@dataclass
+class CustomizeResult:
+    """
+    Outcome of one resume customization.
+
+    Also supports ``result["success"]``-style access, so code written against
+    the earlier dictionary results keeps working.
+    """
+
+    success: bool = False
+    output_file: Optional[str] = None
+    latex_file: Optional[str] = None
+    error: Optional[str] = None
+    # Background conversion (async_convert); result() is the output path. Until
+    # it finishes, success stays False and output_file None.
+    output_future: Optional[Future] = None
+
+    def __getitem__(self, key: str):
+        if key not in self.__dataclass_fields__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value) -> None:
+        if key not in self.__dataclass_fields__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def get(self, key: str, default=None):
+        """Return a field's value, or ``default`` for unknown keys."""
+        return getattr(self, key) if key in self.__dataclass_fields__ else default
+
+    def to_dict(self) -> dict:
+        """Return the result as a plain dictionary."""
+        # Not dataclasses.asdict, which would deep-copy the Future
+        return {name: getattr(self, name) for name in self.__dataclass_fields__}
 
 
 class ResumeCustomizer:
     """Main application class for resume customization."""
 
     def __init__(
-        self, api_key: Optional[str] = None, model: str = "gemini-2.0-flash-exp"
+        self,
+        api_key: Optional[str] = None,
+        model: str = "gemini-2.0-flash-exp",
+        use_semantic_cache: bool = False,
+        use_response_cache: bool = False,
     ):
         """
         Initialize the Resume Customizer.
@@ -19,10 +75,72 @@ class ResumeCustomizer:
         Args:
             api_key: Google Gemini API key (optional, reads from GEMINI_API_KEY env var if not provided)
             model: Gemini model to use
+            use_semantic_cache: Reuse LaTeX generated for the same resume and a
+                near-identical job description (requires sentence-transformers)
+            use_response_cache: Answer byte-identical Gemini prompts (e.g. a
+                retried run, or the validation pass of one) from a local cache
         """
-        self.gemini_client = GeminiResumeGenerator(api_key=api_key, model=model)
-        self.parser = ResumeParser()
-        self.converter = LaTeXConverter()
+        self.api_key = api_key
+        self.model = model
+        self.use_response_cache = use_response_cache
+
+        # Components are created on first use, so e.g. checking the system
+        # requirements never imports or initializes the Gemini SDK
+        self._gemini_client: Optional["GeminiResumeGenerator"] = None
+        self._parser: Optional["ResumeParser"] = None
+        self._converter: Optional["LaTeXConverter"] = None
+
+        # Result of the API key lookup in check_system_requirements
+        self._api_key_cached: Optional[bool] = None
+
+        self._convert_pool: Optional[ThreadPoolExecutor] = None
+
+        # Set once the embedding model failed to load for the alignment check
+        self._alignment_check_failed = False
+
+        self.semantic_cache = None
+        if use_semantic_cache:
+            from .semantic_cache import SemanticCache, embeddings_available
+
+            if not embeddings_available():
+                raise ImportError(
+                    "sentence-transformers is required for the semantic cache. "
+                    "Install it with: pip install 'resume-customizer[semantic-cache]'"
+                )
+            self.semantic_cache = SemanticCache()
+
+    @property
+    def gemini_client(self) -> "GeminiResumeGenerator":
+        """Gemini client, created on first access."""
+        if self._gemini_client is None:
+            from .gemini_client import RESPONSE_CACHE_DIR, GeminiResumeGenerator
+
+            self._gemini_client = GeminiResumeGenerator(
+                api_key=self.api_key,
+                model=self.model,
+                response_cache_dir=(
+                    RESPONSE_CACHE_DIR if self.use_response_cache else None
+                ),
+            )
+        return self._gemini_client
+
+    @property
+    def parser(self) -> "ResumeParser":
+        """Resume parser, created on first access."""
+        if self._parser is None:
+            from .resume_parser import ResumeParser
+
+            self._parser = ResumeParser()
+        return self._parser
+
+    @property
+    def converter(self) -> "LaTeXConverter":
+        """LaTeX converter, created on first access."""
+        if self._converter is None:
+            from .latex_converter import LaTeXConverter
+
+            self._converter = LaTeXConverter()
+        return self._converter
 
     def customize_resume(
         self,
@@ -32,8 +150,11 @@ class ResumeCustomizer:
         output_format: Literal["pdf", "docx", "tex"] = "pdf",
         custom_instructions: Optional[str] = None,
         save_latex: bool = True,
-        two_pass: bool = True,
-    ) -> dict:
+        two_pass: bool = False,
+        docx_via_latex: bool = False,
+        async_convert: bool = False,
+        auto_two_pass: bool = True,
+    ) -> CustomizeResult:
         """
         Customize a resume for a specific job description.
 
@@ -44,146 +165,805 @@ class ResumeCustomizer:
             output_format: Output format ('pdf', 'docx', or 'tex')
             custom_instructions: Additional instructions for customization
             save_latex: Whether to also save the LaTeX source code
-            two_pass: Use two-pass generation (generate + validate/enhance)
+            two_pass: Run an extra validation pass after generation (slower)
+            docx_via_latex: For 'docx' output, generate LaTeX and convert it with
+                pandoc instead of building the document from structured data.
+                The structured route saves no LaTeX source and ignores
+                two_pass and the semantic cache.
+            async_convert: Return as soon as the LaTeX is saved and run the
+                PDF/DOCX conversion in the background. The result's
+                output_future resolves to the output file path; success,
+                output_file and error are filled in when it finishes.
+            auto_two_pass: With two_pass, skip the validation call when the
+                resume already closely matches the job description (needs
+                sentence-transformers, whose model is downloaded on first use;
+                without it, or if the model can't load, two_pass is honored)
 
         Returns:
-            dict: Dictionary containing paths to generated files and status
+            CustomizeResult: Paths to the generated files and status
         """
-        result = {
-            "success": False,
-            "output_file": None,
-            "latex_file": None,
-            "error": None,
-        }
+        result = CustomizeResult()
 
         try:
-            # Step 1: Parse resume
-            print("📄 Parsing resume...")
-            resume_text = self.parser.parse_resume(resume_path)
+            # Fail before any parsing or API call if the output can't be produced
+            self._preflight(output_path, output_format, docx_via_latex=docx_via_latex)
+
+            # Steps 1-2: Parse resume and job description. Both are independent
+            # file reads/extractions, so they run side by side.
+            logger.info("📄 Parsing resume and job description...")
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                resume_future = pool.submit(self.parser.parse_resume, resume_path)
+                job_desc_future = pool.submit(
+                    self.parser.parse_job_description, job_description
+                )
+                resume_text = resume_future.result()
+                job_desc_text = job_desc_future.result()
 
             if not self.parser.validate_resume_content(resume_text):
                 raise ValueError("Resume content is too short or empty")
+            if not self.parser.validate_job_description(job_desc_text):
+                raise ValueError("Job description is too short or empty")
 
-            print(f"✓ Resume parsed successfully ({len(resume_text)} characters)")
-
-            # Step 2: Parse job description
-            print("📋 Parsing job description...")
-            job_desc_text = self.parser.parse_job_description(job_description)
-            print(
+            logger.info(f"✓ Resume parsed successfully ({len(resume_text)} characters)")
+            logger.info(
                 f"✓ Job description parsed successfully ({len(job_desc_text)} characters)"
             )
 
-            # Step 3: Generate customized LaTeX
-            if two_pass:
-                print("🤖 Pass 1/2: Generating customized resume with Gemini API...")
+            # Word output is built directly from structured data, skipping
+            # LaTeX and pandoc altogether
+            if output_format == "docx" and not docx_via_latex:
+                self._log_structured_docx_limits(save_latex, two_pass)
+                self._write_structured_docx(
+                    resume_text, job_desc_text, output_path, custom_instructions, result
+                )
+                return result
+
+            if two_pass and auto_two_pass and self._is_aligned(
+                resume_text, job_desc_text
+            ):
+                logger.info("✓ Skipping validation pass (high baseline alignment)")
+                two_pass = False
+
+            # Step 3: Generate customized LaTeX, reusing a similar earlier
+            # result when the semantic cache is enabled. Single-pass .tex
+            # output is written to disk while the response streams in.
+            latex_path = Path(output_path).with_suffix(".tex")
+            stream_to = latex_path if output_format == "tex" and not two_pass else None
+            latex_code = None
+            cache_miss = False
+            if self.semantic_cache is not None:
+                variant = self.semantic_cache.variant_key(custom_instructions, two_pass)
+                latex_code = self._semantic_cache_get(
+                    resume_text, job_desc_text, variant
+                )
+
+            if latex_code is not None:
+                logger.info(
+                    "✓ Reusing LaTeX generated for a similar request (semantic cache)"
+                )
+                stream_to = None
             else:
-                print("🤖 Generating customized resume with Gemini API...")
+                latex_code = self._generate_latex(
+                    resume_text,
+                    job_desc_text,
+                    custom_instructions,
+                    two_pass,
+                    stream_to=stream_to,
+                )
+                cache_miss = self.semantic_cache is not None
+
+            # Steps 4-5: Save LaTeX and convert to desired format
+            self._write_outputs(
+                latex_code,
+                output_path,
+                output_format,
+                save_latex,
+                result,
+                async_convert=async_convert,
+                latex_saved=stream_to is not None,
+            )
+
+            # Only LaTeX that converted is worth reusing
+            if cache_miss:
+                store = functools.partial(
+                    self._semantic_cache_put,
+                    resume_text,
+                    job_desc_text,
+                    variant,
+                    latex_code,
+                )
+                if result.output_future is not None:
+
+                    def store_if_converted(future: Future) -> None:
+                        if future.exception() is None:
+                            store()
+
+                    result.output_future.add_done_callback(store_if_converted)
+                elif result.success:
+                    store()
+
+        except Exception as e:
+            result.error = str(e)
+            logger.error(f"❌ Error: {str(e)}")
+
+        return result
+
+    def customize_batch(
+        self,
+        jobs: List[dict],
+        output_format: Literal["pdf", "docx", "tex"] = "pdf",
+        custom_instructions: Optional[str] = None,
+        save_latex: bool = True,
+        timeout: Optional[float] = None,
+    ) -> List[CustomizeResult]:
+        """
+        Customize many resumes in a single Gemini Batch API job.
+
+        Batch jobs cost less than interactive calls and avoid per-minute rate
+        limits, but may take minutes (or longer) to complete.
+
+        Args:
+            jobs: List of dicts with 'resume_path', 'job_description' and
+                'output_path' keys (same meaning as in customize_resume)
+            output_format: Output format ('pdf', 'docx', or 'tex'). The batch
+                job returns LaTeX, so 'docx' is always converted with pandoc.
+            custom_instructions: Additional instructions applied to every job
+            save_latex: Whether to also save the LaTeX source code
+            timeout: Maximum seconds to wait for the batch job (None waits indefinitely)
+
+        Returns:
+            list: One CustomizeResult per job, in input order
+        """
+        results = self._empty_results(len(jobs))
+
+        # Steps 1-2: Parse every resume and job description up front
+        pending = self._parse_jobs(jobs, results, output_format)
+        if not pending:
+            return results
+
+        # Step 3: Generate all LaTeX documents in one batch job
+        logger.info(f"🤖 Submitting {len(pending)} jobs to the Gemini Batch API...")
+        try:
+            latex_codes = self.gemini_client.generate_batch(
+                [(resume, jd) for _, resume, jd in pending],
+                custom_instructions=custom_instructions,
+                timeout=timeout,
+            )
+        except Exception as e:
+            for idx, _, _ in pending:
+                results[idx].error = str(e)
+            logger.error(f"❌ Error: {str(e)}")
+            return results
+
+        logger.info("✓ Batch job completed")
+
+        # Steps 4-5: Save and convert each result
+        for (idx, _, _), latex_code in zip(pending, latex_codes):
+            result = results[idx]
+            if latex_code is None:
+                result.error = "Batch request failed"
+                continue
+            try:
+                self._write_outputs(
+                    latex_code,
+                    jobs[idx]["output_path"],
+                    output_format,
+                    save_latex,
+                    result,
+                )
+            except Exception as e:
+                result.error = str(e)
+                logger.error(f"❌ Error in job {idx + 1}: {str(e)}")
+
+        return results
+
+    def customize_many(
+        self,
+        jobs: List[dict],
+        output_format: Literal["pdf", "docx", "tex"] = "pdf",
+        custom_instructions: Optional[str] = None,
+        save_latex: bool = True,
+        max_concurrency: int = 4,
+        max_workers: Optional[int] = None,
+        docx_via_latex: bool = False,
+    ) -> List[CustomizeResult]:
+        """
+        Customize many resumes concurrently, each job running end to end.
+
+        Unlike customize_batch, results come back interactively; throughput is
+        bounded by max_concurrency, which should respect your API rate limit.
+        There is no barrier between stages: a job's conversion starts as soon
+        as its own Gemini response arrives.
+
+        Args:
+            jobs: List of dicts with 'resume_path', 'job_description' and
+                'output_path' keys (same meaning as in customize_resume)
+            output_format: Output format ('pdf', 'docx', or 'tex')
+            custom_instructions: Additional instructions applied to every job
+            save_latex: Whether to also save the LaTeX source code
+            max_concurrency: Maximum number of Gemini requests in flight
+            max_workers: Maximum number of parallel parses/conversions
+                (default: CPU count)
+            docx_via_latex: For 'docx' output, convert generated LaTeX with
+                pandoc (see customize_resume)
+
+        Returns:
+            list: One CustomizeResult per job, in input order
+        """
+
+        async def run_all():
+            # Parsing and conversion run via asyncio.to_thread; pdflatex and
+            # pandoc are child processes, so threads keep every core busy
+            asyncio.get_running_loop().set_default_executor(
+                ThreadPoolExecutor(max_workers=max_workers or os.cpu_count())
+            )
+            semaphore = asyncio.Semaphore(max_concurrency)
+            return await asyncio.gather(
+                *(
+                    self.customize_resume_async(
+                        job["resume_path"],
+                        job["job_description"],
+                        job["output_path"],
+                        output_format=output_format,
+                        custom_instructions=custom_instructions,
+                        save_latex=save_latex,
+                        semaphore=semaphore,
+                        docx_via_latex=docx_via_latex,
+                    )
+                    for job in jobs
+                )
+            )
+
+        if output_format == "docx" and not docx_via_latex:
+            self._log_structured_docx_limits(save_latex, two_pass=False)
+        try:
+            gemini_client = self.gemini_client
+        except Exception as e:
+            results = self._empty_results(len(jobs))
+            for result in results:
+                result.error = str(e)
+            logger.error(f"❌ Error: {str(e)}")
+            return results
+
+        logger.info(f"🤖 Customizing {len(jobs)} resumes concurrently...")
+        with gemini_client.prompt_cache():
+            return asyncio.run(run_all())
+
+    def _semantic_cache_get(
+        self, resume_text: str, job_desc_text: str, variant: str
+    ) -> Optional[str]:
+        """Look up the semantic cache; an embedding failure counts as a miss."""
+        try:
+            return self.semantic_cache.get(resume_text, job_desc_text, variant)
+        except Exception as e:
+            logger.warning(f"⚠️  Semantic cache lookup failed: {e}")
+            return None
+
+    def _semantic_cache_put(
+        self, resume_text: str, job_desc_text: str, variant: str, latex_code: str
+    ) -> None:
+        """Store converted LaTeX in the semantic cache, never failing the run."""
+        try:
+            self.semantic_cache.put(resume_text, job_desc_text, variant, latex_code)
+        except Exception as e:
+            logger.warning(f"⚠️  Could not store result in the semantic cache: {e}")
+
+    def _is_aligned(self, resume_text: str, job_desc_text: str) -> bool:
+        """
+        Check whether the resume already closely matches the job description.
+
+        Both texts are embedded in full (in chunks, see semantic_cache.embed).
+        This is only a shortcut: if the embedding model can't be loaded (e.g.
+        offline before it was ever downloaded), the answer is False and the
+        validation pass runs as requested.
+        """
+        from .semantic_cache import EMBEDDING_MODEL, embeddings_available, similarity
+
+        if self._alignment_check_failed or not embeddings_available():
+            return False
+
+        logger.info(
+            f"🔎 Checking resume/job alignment with {EMBEDDING_MODEL} "
+            "(downloaded on first use)..."
+        )
+        try:
+            score = similarity(resume_text, job_desc_text)
+        except Exception as e:
+            self._alignment_check_failed = True
+            logger.warning(
+                f"⚠️  Alignment check unavailable, running the validation pass: {e}"
+            )
+            return False
+        return score > ALIGNMENT_SKIP_THRESHOLD
+
+    def _generate_latex(
+        self,
+        resume_text: str,
+        job_desc_text: str,
+        custom_instructions: Optional[str],
+        two_pass: bool,
+        stream_to: Optional[Path] = None,
+    ) -> str:
+        """
+        Generate customized LaTeX with the Gemini API.
+
+        With ``stream_to`` (single-pass only), the response is written to
+        that file as it arrives instead of after generation finishes.
+        """
+        if stream_to is not None:
+            logger.info("🤖 Generating customized resume with Gemini API...")
+            latex_code = self._stream_latex_to_file(
+                resume_text, job_desc_text, custom_instructions, stream_to
+            )
+            logger.info("✓ LaTeX code generated successfully")
+            return latex_code
+
+        if two_pass:
+            logger.info("🤖 Pass 1/2: Generating customized resume with Gemini API...")
+        else:
+            logger.info("🤖 Generating customized resume with Gemini API...")
+
+        if custom_instructions:
+            latex_code = self.gemini_client.generate_with_custom_instructions(
+                current_resume=resume_text,
+                job_description=job_desc_text,
+                custom_instructions=custom_instructions,
+                two_pass=two_pass,
+            )
+        else:
+            latex_code = self.gemini_client.generate_customized_resume(
+                current_resume=resume_text,
+                job_description=job_desc_text,
+                two_pass=two_pass,
+            )
+
+        if two_pass:
+            logger.info("✓ Two-pass generation completed (generated + validated)")
+        else:
+            logger.info("✓ LaTeX code generated successfully")
 
-            if custom_instructions:
-                latex_code = self.gemini_client.generate_with_custom_instructions(
+        return latex_code
+
+    def _stream_latex_to_file(
+        self,
+        resume_text: str,
+        job_desc_text: str,
+        custom_instructions: Optional[str],
+        latex_path: Path,
+    ) -> str:
+        """
+        Stream generated LaTeX into ``latex_path`` and return the cleaned code.
+
+        The response is streamed into a temporary file next to ``latex_path``
+        that replaces it only once the stream completes, so a failed request
+        leaves an existing file untouched.
+        """
+        latex_path.parent.mkdir(parents=True, exist_ok=True)
+        partial_path = latex_path.with_name(f".{latex_path.name}.{os.getpid()}.part")
+
+        chunks = []
+        try:
+            with open(partial_path, "wb") as f:
+                for chunk in self.gemini_client.stream_customized_resume(
                     current_resume=resume_text,
                     job_description=job_desc_text,
                     custom_instructions=custom_instructions,
-                    two_pass=two_pass,
+                ):
+                    chunks.append(chunk)
+                    f.write(chunk.encode("utf-8"))
+            os.replace(partial_path, latex_path)
+        finally:
+            if partial_path.exists():
+                partial_path.unlink()
+
+        # Rewrite the file if the model wrapped the code in markdown fences
+        raw_latex = "".join(chunks)
+        latex_code = self.gemini_client._clean_latex_response(raw_latex)
+        if latex_code != raw_latex:
+            self.converter.save_latex(latex_code, latex_path)
+        return latex_code
+
+    async def customize_resume_async(
+        self,
+        resume_path: Union[str, Path],
+        job_description: Union[str, Path],
+        output_path: Union[str, Path],
+        output_format: Literal["pdf", "docx", "tex"] = "pdf",
+        custom_instructions: Optional[str] = None,
+        save_latex: bool = True,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        docx_via_latex: bool = False,
+    ) -> CustomizeResult:
+        """
+        Asynchronously customize a resume for a specific job description.
+
+        Parsing and conversion run in worker threads and the Gemini request is
+        awaited, so many calls can be in flight at once (see
+        customize_many). Always uses single-pass LaTeX generation.
+
+        Args:
+            resume_path: Path to the current resume file (supports .txt, .pdf, .docx)
+            job_description: Job description text or path to file
+            output_path: Path for the output file
+            output_format: Output format ('pdf', 'docx', or 'tex')
+            custom_instructions: Additional instructions for customization
+            save_latex: Whether to also save the LaTeX source code
+            semaphore: Optional semaphore limiting concurrent Gemini requests
+            docx_via_latex: For 'docx' output, convert generated LaTeX with
+                pandoc (see customize_resume)
+
+        Returns:
+            CustomizeResult: Paths to the generated files and status
+        """
+        result = CustomizeResult()
+
+        try:
+            self._preflight(output_path, output_format, docx_via_latex=docx_via_latex)
+
+            resume_text, job_desc_text = await asyncio.to_thread(
+                self._parse_pair, resume_path, job_description
+            )
+
+            if semaphore is None:
+                # A lone call has nothing to throttle
+                semaphore = asyncio.Semaphore(1)
+
+            if output_format == "docx" and not docx_via_latex:
+                async with semaphore:
+                    await asyncio.to_thread(
+                        self._write_structured_docx,
+                        resume_text,
+                        job_desc_text,
+                        output_path,
+                        custom_instructions,
+                        result,
+                    )
+                return result
+
+            async with semaphore:
+                latex_code = await self.gemini_client.agenerate_customized_resume(
+                    resume_text, job_desc_text, custom_instructions=custom_instructions
                 )
-            else:
-                latex_code = self.gemini_client.generate_customized_resume(
-                    current_resume=resume_text,
-                    job_description=job_desc_text,
-                    two_pass=two_pass,
+
+            await asyncio.to_thread(
+                self._write_outputs,
+                latex_code,
+                output_path,
+                output_format,
+                save_latex,
+                result,
+            )
+
+        except Exception as e:
+            result.error = str(e)
+            logger.error(f"❌ Error: {str(e)}")
+
+        return result
+
+    @staticmethod
+    def _empty_results(count: int) -> List[CustomizeResult]:
+        """Create the initial results for a multi-job run."""
+        return [CustomizeResult() for _ in range(count)]
+
+    def _parse_jobs(
+        self, jobs: List[dict], results: List[CustomizeResult], output_format: str
+    ) -> List[tuple]:
+        """
+        Run the preflight checks and parse the inputs of every job.
+
+        Failures are recorded in ``results``; the returned list holds
+        (index, resume_text, job_desc_text) for the jobs that are ready for
+        generation.
+        """
+        logger.info(f"📄 Parsing {len(jobs)} resume/job description pairs...")
+        pending = []
+        for idx, job in enumerate(jobs):
+            try:
+                self._preflight(job["output_path"], output_format, docx_via_latex=True)
+                resume_text, job_desc_text = self._parse_pair(
+                    job["resume_path"], job["job_description"]
                 )
+                pending.append((idx, resume_text, job_desc_text))
+            except Exception as e:
+                results[idx].error = str(e)
+                logger.error(f"❌ Error in job {idx + 1}: {str(e)}")
+        return pending
 
-            if two_pass:
-                print("✓ Two-pass generation completed (generated + validated)")
-            else:
-                print("✓ LaTeX code generated successfully")
-
-            # Step 4: Save LaTeX if requested or if output format is 'tex'
-            output_path = Path(output_path)
-            if save_latex or output_format == "tex":
-                latex_path = output_path.with_suffix(".tex")
-                self.converter.save_latex(latex_code, latex_path)
-                result["latex_file"] = str(latex_path)
-                print(f"✓ LaTeX source saved to: {latex_path}")
-
-            # Step 5: Convert to desired format
-            if output_format == "tex":
-                result["output_file"] = result["latex_file"]
-                result["success"] = True
-            else:
-                print(f"📦 Converting to {output_format.upper()}...")
+    def _preflight(
+        self,
+        output_path: Union[str, Path],
+        output_format: str,
+        docx_via_latex: bool = False,
+    ) -> None:
+        """
+        Check that the requested output can be produced.
+
+        Runs before parsing and generation so a missing converter or an
+        unwritable output directory does not cost a Gemini call.
+
+        Raises:
+            ValueError: If the output format is not supported
+            RuntimeError: If the converter for the output format is missing
+            PermissionError: If the output directory is not writable
+        """
+        if output_format not in ("pdf", "docx", "tex"):
+            raise ValueError(f"Unsupported output format: {output_format}")
+
+        # Only LaTeX conversions need external tools; the probe is cached, but
+        # its first run imports pypandoc and spawns subprocesses
+        needs_pdflatex = output_format == "pdf"
+        needs_pandoc = output_format == "docx" and docx_via_latex
+        if needs_pdflatex or needs_pandoc:
+            dependencies = self.converter.check_dependencies()
+        if needs_pdflatex and not (
+            dependencies["pdflatex"] or dependencies["tectonic"]
+        ):
+            raise RuntimeError(
+                "pdflatex not found. Please install LaTeX (e.g., TeX Live, MiKTeX) "
+                "or Tectonic to generate PDF files"
+            )
+        if needs_pandoc and not dependencies["pandoc"]:
+            raise RuntimeError(
+                "Pandoc not found. Please install Pandoc to convert LaTeX to Word, "
+                "or drop docx_via_latex"
+            )
+
+        output_dir = Path(output_path).parent
+        output_dir.mkdir(parents=True, exist_ok=True)
+        if not os.access(output_dir, os.W_OK):
+            raise PermissionError(f"Output directory is not writable: {output_dir}")
+
+    def _parse_pair(
+        self, resume_path: Union[str, Path], job_description: Union[str, Path]
+    ) -> tuple:
+        """Parse and validate one resume and its job description."""
+        resume_text = self.parser.parse_resume(resume_path)
+        if not self.parser.validate_resume_content(resume_text):
+            raise ValueError("Resume content is too short or empty")
+        job_desc_text = self.parser.parse_job_description(job_description)
+        if not self.parser.validate_job_description(job_desc_text):
+            raise ValueError("Job description is too short or empty")
+        return resume_text, job_desc_text
+
+    def _write_outputs(
+        self,
+        latex_code: str,
+        output_path: Union[str, Path],
+        output_format: str,
+        save_latex: bool,
+        result: CustomizeResult,
+        async_convert: bool = False,
+        latex_saved: bool = False,
+    ) -> None:
+        """
+        Save the LaTeX source and convert it to the requested format.
+
+        ``latex_saved`` means the .tex file was already written (streamed).
+        """
+        # Save LaTeX if requested or if output format is 'tex'
+        output_path = Path(output_path)
+        if latex_saved:
+            result.latex_file = str(output_path.with_suffix(".tex"))
+            logger.info(f"✓ LaTeX source saved to: {result.latex_file}")
+        elif save_latex or output_format == "tex":
+            latex_path = output_path.with_suffix(".tex")
+            self.converter.save_latex(latex_code, latex_path)
+            result.latex_file = str(latex_path)
+            logger.info(f"✓ LaTeX source saved to: {latex_path}")
+
+        # Convert to desired format
+        if output_format == "tex":
+            result.output_file = result.latex_file
+            result.success = True
+        elif async_convert:
+            logger.info(f"📦 Converting to {output_format.upper()} in the background...")
+            result.output_future = self._get_convert_pool().submit(
+                self._convert_in_background,
+                latex_code,
+                output_path,
+                output_format,
+                result,
+            )
+        else:
+            logger.info(f"📦 Converting to {output_format.upper()}...")
+            try:
                 output_file = self.converter.convert(
                     latex_code=latex_code,
                     output_path=str(output_path),
                     output_format=output_format,
                 )
-                result["output_file"] = output_file
-                result["success"] = True
-                print(f"✓ Resume generated successfully: {output_file}")
+            except Exception:
+                self._forget_response(latex_code)
+                raise
+            result.output_file = output_file
+            result.success = True
+            logger.info(f"✓ Resume generated successfully: {output_file}")
+
+    def _convert_in_background(
+        self,
+        latex_code: str,
+        output_path: Path,
+        output_format: str,
+        result: CustomizeResult,
+    ) -> str:
+        """
+        Run one async_convert conversion and record its outcome in ``result``.
 
+        The result is updated before the future resolves, so it is complete
+        once output_future.result() returns or raises.
+        """
+        try:
+            output_file = self.converter.convert(
+                latex_code=latex_code,
+                output_path=str(output_path),
+                output_format=output_format,
+            )
         except Exception as e:
-            result["error"] = str(e)
-            print(f"❌ Error: {str(e)}")
+            self._forget_response(latex_code)
+            result.error = str(e)
+            logger.error(f"❌ Error: {str(e)}")
+            raise
 
-        return result
+        result.output_file = output_file
+        result.success = True
+        logger.info(f"✓ Resume generated successfully: {output_file}")
+        return output_file
+
+    def _forget_response(self, latex_code: str) -> None:
+        """Keep LaTeX that failed to convert out of the response cache."""
+        if self.use_response_cache and self._gemini_client is not None:
+            self._gemini_client.evict_cached_response(latex_code)
+
+    def _get_convert_pool(self) -> ThreadPoolExecutor:
+        """Return the executor for background conversions, creating it on first use."""
+        # pdflatex/pandoc run as child processes, so threads are enough to
+        # run one conversion per core
+        if self._convert_pool is None:
+            self._convert_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+        return self._convert_pool
+
+    def _log_structured_docx_limits(self, save_latex: bool, two_pass: bool) -> None:
+        """Say which requested options the structured DOCX route can't honor."""
+        if save_latex:
+            logger.info(
+                "ℹ️  Structured DOCX output has no LaTeX source to save "
+                "(use docx_via_latex / --docx-via-latex to keep one)"
+            )
+        if two_pass:
+            logger.info("ℹ️  Two-pass validation does not apply to structured DOCX")
+        if self.semantic_cache is not None:
+            logger.info("ℹ️  The semantic cache does not apply to structured DOCX")
+
+    def _write_structured_docx(
+        self,
+        resume_text: str,
+        job_desc_text: str,
+        output_path: Union[str, Path],
+        custom_instructions: Optional[str],
+        result: CustomizeResult,
+    ) -> None:
+        """Generate structured resume data and write it as a Word document."""
+        from .docx_writer import DocxResumeWriter
+
+        logger.info("🤖 Generating customized resume with Gemini API...")
+        resume_data = self.gemini_client.generate_structured_resume(
+            current_resume=resume_text,
+            job_description=job_desc_text,
+            custom_instructions=custom_instructions,
+        )
+        logger.info("✓ Structured resume generated successfully")
+
+        logger.info("📦 Writing DOCX...")
+        output_file = DocxResumeWriter().write(resume_data, output_path)
+        result.output_file = output_file
+        result.success = True
+        logger.info(f"✓ Resume generated successfully: {output_file}")
+
+    def has_api_key(self) -> bool:
+        """
+        Check whether a Gemini API key is configured.
+
+        Does not initialize the Gemini client; the answer is cached until
+        invalidate_system_cache() is called.
+
+        Returns:
+            bool: True if an API key was passed or found in the environment
+        """
+        if self._api_key_cached is None:
+            self._api_key_cached = bool(self._resolve_api_key())
+        return self._api_key_cached
+
+    def _resolve_api_key(self) -> Optional[str]:
+        """Return the API key the Gemini client would use, if any."""
+        if self._gemini_client is not None:
+            return self._gemini_client.api_key
+
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        return self.api_key or os.getenv("GEMINI_API_KEY")
+
+    def invalidate_system_cache(self) -> None:
+        """
+        Forget cached system requirement checks.
+
+        Call this after installing a dependency or setting the API key
+        mid-session so the next check_system_requirements() probes again.
+        """
+        self._api_key_cached = None
+        self.converter.invalidate_dependency_cache()
 
     def check_system_requirements(self) -> dict:
         """
         Check if all system requirements are met.
 
+        Dependency probes and the API key lookup are cached; see
+        invalidate_system_cache().
+
         Returns:
             dict: Status of system requirements
         """
-        print("🔍 Checking system requirements...")
+        logger.info("🔍 Checking system requirements...")
 
         dependencies = self.converter.check_dependencies()
+        pdf_support = dependencies["pdflatex"] or dependencies["tectonic"]
 
-        print("\n📋 Dependency Status:")
-        print(
+        logger.info("\n📋 Dependency Status:")
+        logger.info(
             f"  • pdflatex: {'✓ Installed' if dependencies['pdflatex'] else '✗ Not found'}"
         )
-        print(
+        logger.info(
+            f"  • tectonic: {'✓ Installed' if dependencies['tectonic'] else '✗ Not found'}"
+        )
+        logger.info(
             f"  • pandoc:   {'✓ Installed' if dependencies['pandoc'] else '✗ Not found'}"
         )
 
-        # Check API key
-        try:
-            api_key_set = bool(self.gemini_client.api_key)
-        except:
-            api_key_set = False
+        api_key_set = self.has_api_key()
 
-        print(f"  • Gemini API Key: {'✓ Set' if api_key_set else '✗ Not set'}")
+        logger.info(f"  • Gemini API Key: {'✓ Set' if api_key_set else '✗ Not set'}")
 
-        print("\n📝 Notes:")
-        if not dependencies["pdflatex"]:
-            print("  - Install LaTeX to generate PDF files (TeX Live, MiKTeX, etc.)")
+        logger.info("\n📝 Notes:")
+        if not pdf_support:
+            logger.info(
+                "  - Install LaTeX to generate PDF files (TeX Live, MiKTeX, Tectonic, etc.)"
+            )
         if not dependencies["pandoc"]:
-            print("  - Install Pandoc to generate Word documents")
+            logger.info(
+                "  - Install Pandoc to convert LaTeX to Word (--docx-via-latex, "
+                "and DOCX output of customize-batch)"
+            )
         if not api_key_set:
-            print(
+            logger.info(
                 "  - Set GEMINI_API_KEY environment variable or pass API key to constructor"
             )
 
         return {
             "pdflatex": dependencies["pdflatex"],
+            "tectonic": dependencies["tectonic"],
             "pandoc": dependencies["pandoc"],
             "api_key": api_key_set,
-            "pdf_support": dependencies["pdflatex"],
-            "docx_support": dependencies["pandoc"],
-            "all_ready": all(
-                [dependencies["pdflatex"], dependencies["pandoc"], api_key_set]
-            ),
+            "pdf_support": pdf_support,
+            "docx_support": True,
+            "docx_via_latex_support": dependencies["pandoc"],
+            "all_ready": all([pdf_support, api_key_set]),
         }
 
 
+@functools.lru_cache(maxsize=4)
+def _shared_customizer(api_key: Optional[str]) -> ResumeCustomizer:
+    """Reuse one ResumeCustomizer per API key across customize_resume_simple calls."""
+    return ResumeCustomizer(api_key=api_key)
+
+
 def customize_resume_simple(
     resume_path: str,
     job_description: str,
     output_path: str,
     output_format: Literal["pdf", "docx", "tex"] = "pdf",
     api_key: Optional[str] = None,
-    two_pass: bool = True,
-) -> dict:
+    two_pass: bool = False,
+) -> CustomizeResult:
     """
     Simplified function to customize a resume.
 
@@ -193,12 +973,12 @@ def customize_resume_simple(
         output_path: Path for output file
         output_format: Output format ('pdf', 'docx', or 'tex')
         api_key: Gemini API key (optional)
-        two_pass: Use two-pass generation (default: True)
+        two_pass: Run an extra validation pass (default: False)
 
     Returns:
-        dict: Result dictionary with file paths and status
+        CustomizeResult: Paths to the generated files and status
     """
-    customizer = ResumeCustomizer(api_key=api_key)
+    customizer = _shared_customizer(api_key)
     return customizer.customize_resume(
         resume_path=resume_path,
         job_description=job_description,
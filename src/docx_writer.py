@@ -0,0 +1,108 @@
+"""Word document writer for structured resume data."""
+
+from pathlib import Path
+from typing import Union
+import docx
+from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_TAB_ALIGNMENT
+from docx.shared import Inches, Pt
+
+
+class DocxResumeWriter:
+    """Builds a one-page style Word resume from structured resume data."""
+
+    # Usable width of a letter page with the margins set below
+    TEXT_WIDTH = Inches(7.5)
+
+    def write(self, resume: dict, output_path: Union[str, Path]) -> str:
+        """
+        Write a resume to a .docx file.
+
+        Args:
+            resume: Resume data following gemini_client.RESUME_SCHEMA
+            output_path: Path for the output .docx file
+
+        Returns:
+            str: Path to the generated file
+        """
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        document = docx.Document()
+        self._set_up_page(document)
+
+        # Header: name and contact line
+        name = document.add_paragraph()
+        name.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        name_run = name.add_run(resume.get("name", ""))
+        name_run.bold = True
+        name_run.font.size = Pt(20)
+
+        contact = resume.get("contact") or []
+        if contact:
+            contact_line = document.add_paragraph(" | ".join(contact))
+            contact_line.alignment = WD_ALIGN_PARAGRAPH.CENTER
+
+        for section in resume.get("sections") or []:
+            self._add_section(document, section)
+
+        document.save(str(output_path))
+        return str(output_path)
+
+    def _set_up_page(self, document) -> None:
+        """Use narrow margins and a compact body font, like the LaTeX template."""
+        for page_section in document.sections:
+            page_section.left_margin = page_section.right_margin = Inches(0.5)
+            page_section.top_margin = page_section.bottom_margin = Inches(0.5)
+
+        normal = document.styles["Normal"]
+        normal.font.name = "Calibri"
+        normal.font.size = Pt(10.5)
+        normal.paragraph_format.space_after = Pt(0)
+
+    def _add_section(self, document, section: dict) -> None:
+        """Add a section heading followed by its entries."""
+        heading = document.add_heading(section.get("title", "").upper(), level=2)
+        heading.paragraph_format.space_before = Pt(8)
+        heading.paragraph_format.space_after = Pt(2)
+
+        for entry in section.get("entries") or []:
+            self._add_entry(document, entry)
+
+    def _add_entry(self, document, entry: dict) -> None:
+        """Add one entry: heading/dates line, subheading/location line, bullets."""
+        self._add_split_line(
+            document, entry.get("heading", ""), entry.get("dates", ""), bold=True
+        )
+
+        if entry.get("subheading") or entry.get("location"):
+            self._add_split_line(
+                document,
+                entry.get("subheading", ""),
+                entry.get("location", ""),
+                italic=True,
+            )
+
+        for bullet in entry.get("bullets") or []:
+            document.add_paragraph(bullet, style="List Bullet")
+
+    def _add_split_line(
+        self,
+        document,
+        left: str,
+        right: str,
+        bold: bool = False,
+        italic: bool = False,
+    ) -> None:
+        """Add a line with text on the left and right-aligned text on the right."""
+        paragraph = document.add_paragraph()
+        paragraph.paragraph_format.tab_stops.add_tab_stop(
+            self.TEXT_WIDTH, WD_TAB_ALIGNMENT.RIGHT
+        )
+
+        left_run = paragraph.add_run(left)
+        left_run.bold = bold
+        left_run.italic = italic
+
+        if right:
+            right_run = paragraph.add_run(f"\t{right}")
+            right_run.italic = italic
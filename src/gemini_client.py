@@ -1,20 +1,285 @@
 """Google Gemini API integration for resume generation."""
 
+import asyncio
+import atexit
+import contextlib
+import functools
+import hashlib
+import json
+import logging
 import os
-from typing import Optional
+import re
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import ClassVar, Dict, Iterator, List, Optional, Tuple, Union
 from google import genai
+from google.genai import errors as genai_errors
 from dotenv import load_dotenv
-from .latex_template import RESUME_LATEX_TEMPLATE, get_template_instructions
+from .latex_template import (
+    RESUME_LATEX_TEMPLATE,
+    get_template_for_llm,
+    get_template_instructions,
+    strip_latex_comments,
+)
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Status messages; the CLI sends them to stdout
+logger = logging.getLogger("resume_customizer")
+
+# Review checklist used as a self-check in the generation prompt and by the
+# optional second validation pass.
+LATEX_REVIEW_CHECKLIST = r"""CHECK FOR THESE ISSUES:
+
+1. **LaTeX SYNTAX ERRORS:**
+   - Missing or mismatched braces {}
+   - Incorrect command usage (\\resumeSubheading, \\resumeItem, etc.)
+   - Special characters that need escaping (%, &, $, #, _, {, })
+   - Malformed URLs or email addresses
+   - Missing required arguments in commands
+
+2. **TEMPLATE COMPLIANCE:**
+   - Ensure ALL commands match the template exactly
+   - No extra packages or modifications to template structure
+   - Correct usage of \\resumeSubheading, \\resumeProjectHeading, etc.
+   - Proper nesting of \\resumeItemListStart and \\resumeItemListEnd
+
+3. **ONE-PAGE CONSTRAINT:**
+   - If content seems too long, condense bullet points
+   - Remove less impactful items
+   - Ensure it will fit on ONE PAGE when compiled
+
+4. **FORMATTING ISSUES:**
+   - Consistent spacing and indentation
+   - Proper date formats
+   - Correct use of emphasis (\\textbf, \\emph)
+   - No orphaned or incomplete sections
+
+5. **CONTENT QUALITY:**
+   - Bullet points are concise (1-2 lines max)
+   - Action verbs used effectively
+   - Metrics included where present
+   - No placeholder text like "ABC Company" or "Your Name"
+   - Professional language throughout
+
+6. **SPECIAL CHARACTER ESCAPING:**
+   - Escape: % \# $ & _ { }
+   - Use \\& for ampersands
+   - Use \\% for percentages
+   - Use \\$ for dollar signs
+   - Use \\# for hashtags
+"""
+
+# Ask for plain text so the model does not wrap the LaTeX in markdown fences,
+# and cap the output so a runaway response cannot stall generation. A filled
+# one-page resume is roughly 3-4K tokens including the template preamble.
+GENERATION_CONFIG = {"response_mime_type": "text/plain", "max_output_tokens": 8192}
+
+# Markdown code block with an optional language tag (```latex, ```tex, ...).
+# Only a word-like tag is consumed, so code on the opening fence line is kept.
+CODE_FENCE_PATTERN = re.compile(r"```[\w+-]*[ \t]*\n?(.*?)(?:```|\Z)", re.DOTALL)
+
+# Framing text of the per-request part of the generation prompt
+PROMPT_INSTRUCTIONS_HEADER = "ADDITIONAL INSTRUCTIONS:\n"
+PROMPT_RESUME_HEADER = "CURRENT RESUME:\n"
+PROMPT_RESUME_HEADER_AFTER_INSTRUCTIONS = "\n\n---\n\n" + PROMPT_RESUME_HEADER
+PROMPT_JOB_HEADER = "\n\n---\n\nJOB DESCRIPTION:\n"
+PROMPT_TAIL = (
+    "\n\n---\n\n"
+    "Now generate the complete LaTeX code for the customized resume. "
+    "Output ONLY the LaTeX code, nothing else.\n"
+)
+
+# JSON schema of the structured resume used for direct DOCX output
+RESUME_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "name": {"type": "STRING"},
+        "contact": {
+            "type": "ARRAY",
+            "items": {"type": "STRING"},
+            "description": "Phone, email, LinkedIn, GitHub, website, ...",
+        },
+        "sections": {
+            "type": "ARRAY",
+            "items": {
+                "type": "OBJECT",
+                "properties": {
+                    "title": {"type": "STRING"},
+                    "entries": {
+                        "type": "ARRAY",
+                        "items": {
+                            "type": "OBJECT",
+                            "properties": {
+                                "heading": {"type": "STRING"},
+                                "dates": {"type": "STRING"},
+                                "subheading": {"type": "STRING"},
+                                "location": {"type": "STRING"},
+                                "bullets": {
+                                    "type": "ARRAY",
+                                    "items": {"type": "STRING"},
+                                },
+                            },
+                            "required": ["heading"],
+                        },
+                    },
+                },
+                "required": ["title", "entries"],
+            },
+        },
+    },
+    "required": ["name", "contact", "sections"],
+}
+
+# Generation settings for structured (JSON) resume output
+STRUCTURED_GENERATION_CONFIG = {
+    "response_mime_type": "application/json",
+    "response_schema": RESUME_SCHEMA,
+    "max_output_tokens": 8192,
+}
+
+# Replaces the LaTeX-specific output rules when asking for structured JSON
+STRUCTURED_OUTPUT_INSTRUCTIONS = """
+OUTPUT FORMAT:
+Instead of LaTeX, return the customized resume as JSON matching the response
+schema. Use plain text only - no LaTeX commands, no escaping, no markdown.
+- name: the candidate's full name
+- contact: one item per contact detail (phone, email, LinkedIn, GitHub, ...)
+- sections: in display order (e.g. Education, Experience, Projects, Technical Skills)
+  - entries: one per school, position or project, with heading (institution,
+    company or project name), dates, subheading (degree, job title or technologies),
+    location and bullets
+  - For a skills section, use one entry per category with the category as heading
+    and the skills as a single bullet
+The same content, tailoring and one-page rules apply.
+"""
+STRUCTURED_PROMPT_TAIL = (
+    "\n\n---\n\n"
+    "Now generate the customized resume as JSON. Output ONLY the JSON, nothing else.\n"
+)
+
+# \newcommand{\name}[args] definitions in a LaTeX template
+NEWCOMMAND_PATTERN = re.compile(r"\\newcommand\{?\\(\w+)\}?(?:\[(\d+)\])?")
+
+# Lifetime of the server-side cache holding the static prompt prefix.
+PROMPT_CACHE_TTL_SECONDS = 3600
+
+# Default directory of the local prompt -> response cache
+RESPONSE_CACHE_DIR = Path.home() / ".cache" / "resume_customizer" / "responses"
+
+# Terminal states of a Gemini batch job
+BATCH_DONE_STATES = {
+    "JOB_STATE_SUCCEEDED",
+    "JOB_STATE_FAILED",
+    "JOB_STATE_CANCELLED",
+    "JOB_STATE_EXPIRED",
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _build_static_prompt(template: str) -> str:
+    """
+    Build the request-independent prompt prefix for a template.
+
+    Memoized because the same template (usually the built-in one) is reused
+    for every request in a process. Template comments are not sent.
+    """
+    instructions = get_template_instructions()
+    if template == RESUME_LATEX_TEMPLATE:
+        template = get_template_for_llm()
+    else:
+        template = strip_latex_comments(template)
+
+    prompt = f"""{instructions}
+
+---
+
+LATEX TEMPLATE TO USE:
+{template}
+
+---
+
+Before answering, review your LaTeX against this checklist and fix every issue it finds:
+
+{LATEX_REVIEW_CHECKLIST}
+---
+
+"""
+    return prompt
+
+
+@functools.lru_cache(maxsize=8)
+def _build_validation_framing(template: str) -> Tuple[str, str]:
+    """
+    Build the validation prompt text that goes before and after the LaTeX.
+
+    Only the generated code varies between second-pass calls, so the framing
+    is precomputed once per template.
+    """
+    head = rf"""You are a LaTeX expert and resume quality reviewer. Your task is to review and enhance the generated LaTeX resume code.
+
+CUSTOM COMMANDS DEFINED BY THE TEMPLATE (use only these, with these arguments):
+{_template_commands(template)}
+
+---
+
+GENERATED LATEX CODE TO REVIEW:
+"""
+    tail = rf"""
+
+---
+
+YOUR TASK:
+Review the generated LaTeX code and fix any issues. Then output the CORRECTED and ENHANCED version.
+
+{LATEX_REVIEW_CHECKLIST}
+CRITICAL RULES:
+✅ Fix all LaTeX syntax errors
+✅ Ensure template structure is followed exactly
+✅ Maintain one-page length
+✅ Improve clarity and impact
+✅ Return ONLY the complete, corrected LaTeX code
+❌ Do NOT add explanations or comments
+❌ Do NOT modify the template structure itself
+❌ Do NOT add new packages
+
+Output the COMPLETE corrected LaTeX document, ready to compile without errors.
+"""
+    return head, tail
+
+
+@functools.lru_cache(maxsize=8)
+def _template_commands(template: str) -> str:
+    """
+    List the custom commands a template defines, one usage skeleton per line.
+
+    The validation pass gets this instead of the whole template; the model
+    already followed the template in the first pass and only needs the
+    command signatures to check the output against.
+    """
+    commands = []
+    for name, arg_count in NEWCOMMAND_PATTERN.findall(template):
+        commands.append(f"\\{name}" + "{}" * int(arg_count or 0))
+    return "\n".join(commands)
+
 
 class GeminiResumeGenerator:
     """Client for generating customized resumes using Google Gemini API."""
 
+    # SDK clients shared by every generator using the same API key, so their
+    # HTTP connection pools are reused instead of set up per instance
+    _clients: ClassVar[Dict[str, genai.Client]] = {}
+    _clients_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(
-        self, api_key: Optional[str] = None, model: str = "gemini-2.5-flash-lite"
+        self,
+        api_key: Optional[str] = None,
+        model: str = "gemini-2.5-flash-lite",
+        use_context_cache: bool = False,
+        response_cache_dir: Optional[Union[str, Path]] = None,
     ):
         """
         Initialize the Gemini client.
@@ -22,6 +287,13 @@ class GeminiResumeGenerator:
         Args:
             api_key: Google Gemini API key. If None, reads from GEMINI_API_KEY env variable.
             model: Model name to use (default: gemini-2.5-flash-lite)
+            use_context_cache: Keep the static template/instructions prefix in a
+                Gemini context cache for the lifetime of this generator, so it is
+                not re-sent with every request. Off by default, since a one-off
+                request gains nothing from it; generate_many() and code inside
+                prompt_cache() use a cache regardless.
+            response_cache_dir: Directory in which to cache responses by prompt
+                hash, so an identical prompt is answered locally (None disables)
         """
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
         if not self.api_key:
@@ -30,14 +302,44 @@ class GeminiResumeGenerator:
             )
 
         self.model = model
-        self.client = genai.Client(api_key=self.api_key)
+        self.client = self._shared_client(self.api_key)
+
+        self.use_context_cache = use_context_cache
+        self._cache_name: Optional[str] = None
+        self._cache_expires_at = 0.0
+        self._cache_lock = threading.Lock()
+        # Number of open prompt_cache() blocks
+        self._cache_scopes = 0
+        # Set when the model/tier rejected cache creation
+        self._cache_unsupported = False
+        self._cache_cleanup_registered = False
+
+        # Hash of a cleaned response -> cache keys it was read from or
+        # written to, so output that turned out bad can be evicted
+        self._response_keys: Dict[str, set] = {}
+        self._response_keys_lock = threading.Lock()
+
+        self.response_cache_dir = None
+        if response_cache_dir is not None:
+            self.response_cache_dir = Path(response_cache_dir)
+            self.response_cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @classmethod
+    def _shared_client(cls, api_key: str) -> genai.Client:
+        """Return the SDK client for an API key, creating it on first use."""
+        key = hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+        with cls._clients_lock:
+            client = cls._clients.get(key)
+            if client is None:
+                client = cls._clients[key] = genai.Client(api_key=api_key)
+            return client
 
     def generate_customized_resume(
         self,
         current_resume: str,
         job_description: str,
         template: Optional[str] = None,
-        two_pass: bool = True,
+        two_pass: bool = False,
     ) -> str:
         """
         Generate a customized resume based on the current resume and job description.
@@ -46,7 +348,9 @@ class GeminiResumeGenerator:
             current_resume: The user's current resume content (text format)
             job_description: The target job description
             template: LaTeX template to use (defaults to built-in template)
-            two_pass: If True, uses two-pass generation (generate + validate/enhance)
+            two_pass: If True, runs a second validation/enhancement call. The
+                review checklist is already part of the first prompt, so this is
+                off by default.
 
         Returns:
             str: Generated LaTeX code for the customized resume
@@ -54,20 +358,16 @@ class GeminiResumeGenerator:
         if template is None:
             template = RESUME_LATEX_TEMPLATE
 
-        # First pass: Generate initial resume
-        prompt = self._construct_prompt(current_resume, job_description, template)
-
         try:
-            response = self.client.models.generate_content(
-                model=self.model, contents=prompt
+            # First pass: Generate initial resume
+            latex_code = "".join(
+                self._stream_resume(current_resume, job_description, template)
             )
-
-            latex_code = response.text
             latex_code = self._clean_latex_response(latex_code)
 
             # Second pass: Validate and enhance if requested
             if two_pass:
-                print("   🔍 Pass 2/2: Validating and enhancing LaTeX code...")
+                logger.info("   🔍 Pass 2/2: Validating and enhancing LaTeX code...")
                 latex_code = self._validate_and_enhance_latex(latex_code, template)
 
             return latex_code
@@ -75,34 +375,480 @@ class GeminiResumeGenerator:
         except Exception as e:
             raise Exception(f"Error generating resume with Gemini API: {str(e)}")
 
-    def _construct_prompt(
-        self, current_resume: str, job_description: str, template: str
+    def stream_customized_resume(
+        self,
+        current_resume: str,
+        job_description: str,
+        template: Optional[str] = None,
+        custom_instructions: Optional[str] = None,
+    ) -> Iterator[str]:
+        """
+        Stream a single-pass customized resume as it is generated.
+
+        Args:
+            current_resume: The user's current resume content
+            job_description: The target job description
+            template: LaTeX template to use (defaults to built-in template)
+            custom_instructions: Additional custom instructions for the LLM
+
+        Yields:
+            str: Raw response text chunks. The joined text may still need
+            ``_clean_latex_response`` if the model added markdown fences.
+        """
+        if template is None:
+            template = RESUME_LATEX_TEMPLATE
+
+        try:
+            yield from self._stream_resume(
+                current_resume, job_description, template, custom_instructions
+            )
+        except Exception as e:
+            raise Exception(f"Error generating resume with Gemini API: {str(e)}")
+
+    async def agenerate_customized_resume(
+        self,
+        current_resume: str,
+        job_description: str,
+        template: Optional[str] = None,
+        custom_instructions: Optional[str] = None,
     ) -> str:
-        """Construct the prompt for the LLM."""
-        instructions = get_template_instructions()
+        """
+        Asynchronously generate a single-pass customized resume.
 
-        prompt = f"""{instructions}
+        Args:
+            current_resume: The user's current resume content
+            job_description: The target job description
+            template: LaTeX template to use (defaults to built-in template)
+            custom_instructions: Additional custom instructions for the LLM
 
----
+        Returns:
+            str: Generated LaTeX code
+        """
+        if template is None:
+            template = RESUME_LATEX_TEMPLATE
 
-CURRENT RESUME:
-{current_resume}
+        request_prompt = self._construct_request_prompt(
+            current_resume, job_description, custom_instructions
+        )
 
----
+        try:
+            cache_name = None
+            if template == RESUME_LATEX_TEMPLATE:
+                cache_name = await asyncio.to_thread(self._get_prompt_cache)
+
+            if cache_name:
+                try:
+                    latex_code = await self._agenerate_text(request_prompt, cache_name)
+                    return self._clean_latex_response(latex_code)
+                except genai_errors.ClientError as e:
+                    # Expired cache; fall back to the inline prompt
+                    if e.code != 404:
+                        raise
+                    self._cache_name = None
+
+            latex_code = await self._agenerate_text(
+                self._construct_static_prompt(template) + request_prompt
+            )
+            return self._clean_latex_response(latex_code)
 
-JOB DESCRIPTION:
-{job_description}
+        except Exception as e:
+            raise Exception(f"Error generating resume with Gemini API: {str(e)}")
 
----
+    def generate_many(
+        self,
+        jobs: List[Tuple[str, str]],
+        custom_instructions: Optional[str] = None,
+        template: Optional[str] = None,
+        max_concurrency: int = 4,
+    ) -> List[Union[str, Exception]]:
+        """
+        Generate customized resumes for many jobs with concurrent API calls.
 
-LATEX TEMPLATE TO USE:
-{template}
+        Args:
+            jobs: List of (current_resume, job_description) text pairs
+            custom_instructions: Additional custom instructions applied to every job
+            template: LaTeX template to use (defaults to built-in template)
+            max_concurrency: Maximum number of requests in flight at once; keep
+                this within the rate limit of your API tier
 
----
+        Returns:
+            list: Generated LaTeX code for each job in input order, or the
+            exception raised for that job
+        """
 
-Now generate the complete LaTeX code for the customized resume. Output ONLY the LaTeX code, nothing else.
-"""
-        return prompt
+        async def run_all():
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def run_one(current_resume, job_description):
+                async with semaphore:
+                    return await self.agenerate_customized_resume(
+                        current_resume, job_description, template, custom_instructions
+                    )
+
+            return await asyncio.gather(
+                *(run_one(resume, jd) for resume, jd in jobs), return_exceptions=True
+            )
+
+        with self.prompt_cache():
+            return asyncio.run(run_all())
+
+    @contextlib.contextmanager
+    def prompt_cache(self) -> Iterator[None]:
+        """
+        Use a context cache for the static prompt prefix within the block.
+
+        Meant for runs that send many requests; the cache is created by the
+        first request and deleted when the outermost block exits (unless the
+        generator was created with use_context_cache=True).
+        """
+        with self._cache_lock:
+            self._cache_scopes += 1
+        try:
+            yield
+        finally:
+            with self._cache_lock:
+                self._cache_scopes -= 1
+                last = self._cache_scopes == 0
+            if last and not self.use_context_cache:
+                self.delete_prompt_cache()
+
+    def delete_prompt_cache(self) -> None:
+        """Delete the server-side context cache, if one was created."""
+        with self._cache_lock:
+            cache_name, self._cache_name = self._cache_name, None
+            self._cache_expires_at = 0.0
+
+        if cache_name:
+            try:
+                self.client.caches.delete(name=cache_name)
+            except Exception:
+                # It still expires on its own after the TTL
+                pass
+
+    def generate_structured_resume(
+        self,
+        current_resume: str,
+        job_description: str,
+        custom_instructions: Optional[str] = None,
+    ) -> dict:
+        """
+        Generate a customized resume as structured data instead of LaTeX.
+
+        Used for direct DOCX output, which needs neither LaTeX nor pandoc.
+
+        Args:
+            current_resume: The user's current resume content
+            job_description: The target job description
+            custom_instructions: Additional custom instructions for the LLM
+
+        Returns:
+            dict: Resume data following RESUME_SCHEMA
+        """
+        prompt = "".join(
+            (
+                get_template_instructions(),
+                STRUCTURED_OUTPUT_INSTRUCTIONS,
+                "\n---\n\n",
+                *self._request_prompt_parts(
+                    current_resume,
+                    job_description,
+                    custom_instructions,
+                    tail=STRUCTURED_PROMPT_TAIL,
+                ),
+            )
+        )
+
+        try:
+            cache_key = self._response_cache_key(prompt)
+            text = self._read_cached_response(cache_key)
+            if text is None:
+                response = self.client.models.generate_content(
+                    model=self.model,
+                    contents=prompt,
+                    config=STRUCTURED_GENERATION_CONFIG,
+                )
+                text = response.text
+            resume_data = json.loads(text)
+            self._write_cached_response(cache_key, text)
+            return resume_data
+
+        except Exception as e:
+            raise Exception(f"Error generating resume with Gemini API: {str(e)}")
+
+    def _stream_resume(
+        self,
+        current_resume: str,
+        job_description: str,
+        template: str,
+        custom_instructions: Optional[str] = None,
+    ) -> Iterator[str]:
+        """
+        Yield the generated resume, using the cached prompt prefix when possible.
+
+        Only the built-in template is cached; a custom template is always sent
+        inline with the request.
+        """
+        request_prompt = self._construct_request_prompt(
+            current_resume, job_description, custom_instructions
+        )
+
+        cache_name = None
+        if template == RESUME_LATEX_TEMPLATE:
+            cache_name = self._get_prompt_cache()
+
+        if cache_name:
+            started = False
+            try:
+                for text in self._stream_text(request_prompt, cache_name):
+                    started = True
+                    yield text
+                return
+            except genai_errors.ClientError as e:
+                # The cache expired or was deleted server-side; fall back to
+                # the inline prompt and recreate the cache on the next call.
+                if started or e.code != 404:
+                    raise
+                self._cache_name = None
+
+        yield from self._stream_text(
+            self._construct_static_prompt(template) + request_prompt
+        )
+
+    def _get_prompt_cache(self) -> Optional[str]:
+        """Return the context cache holding the static prompt, creating it if needed."""
+        if self._cache_unsupported or not (
+            self.use_context_cache or self._cache_scopes
+        ):
+            return None
+
+        # Concurrent requests must not each create their own cache
+        with self._cache_lock:
+            now = time.monotonic()
+            if self._cache_name and now < self._cache_expires_at:
+                return self._cache_name
+
+            try:
+                cache = self.client.caches.create(
+                    model=self.model,
+                    config={
+                        "contents": [
+                            self._construct_static_prompt(RESUME_LATEX_TEMPLATE)
+                        ],
+                        "ttl": f"{PROMPT_CACHE_TTL_SECONDS}s",
+                    },
+                )
+            except Exception:
+                # Not every model/tier supports caching, and prompts below the
+                # minimum cacheable size are rejected; use inline prompts instead.
+                self._cache_unsupported = True
+                return None
+
+            # Don't leave a billed cache behind when the process ends
+            if not self._cache_cleanup_registered:
+                atexit.register(self.delete_prompt_cache)
+                self._cache_cleanup_registered = True
+
+            self._cache_name = cache.name
+            # Refresh slightly before the server-side TTL runs out
+            self._cache_expires_at = now + PROMPT_CACHE_TTL_SECONDS - 60
+            return self._cache_name
+
+    def _stream_text(
+        self, prompt: str, cached_content: Optional[str] = None
+    ) -> Iterator[str]:
+        """Yield response text chunks from Gemini as they arrive."""
+        cache_key = self._response_cache_key(prompt, cached_content)
+        cached = self._read_cached_response(cache_key)
+        if cached is not None:
+            yield cached
+            return
+
+        chunks = []
+        for chunk in self.client.models.generate_content_stream(
+            model=self.model,
+            contents=prompt,
+            config=self._generation_config(cached_content),
+        ):
+            if chunk.text:
+                chunks.append(chunk.text)
+                yield chunk.text
+
+        self._write_cached_response(cache_key, "".join(chunks))
+
+    def _generate_text(self, prompt: str) -> str:
+        """Stream a response from Gemini and return the accumulated text."""
+        return "".join(self._stream_text(prompt))
+
+    async def _agenerate_text(
+        self, prompt: str, cached_content: Optional[str] = None
+    ) -> str:
+        """Generate a response with the async client."""
+        cache_key = self._response_cache_key(prompt, cached_content)
+        cached = self._read_cached_response(cache_key)
+        if cached is not None:
+            return cached
+
+        response = await self.client.aio.models.generate_content(
+            model=self.model,
+            contents=prompt,
+            config=self._generation_config(cached_content),
+        )
+        text = response.text or ""
+        self._write_cached_response(cache_key, text)
+        return text
+
+    def _response_cache_key(
+        self, prompt: str, cached_content: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Hash the full prompt a request sends, or return None if caching is off.
+
+        A request against the context cache hashes the same text as the
+        equivalent inline request, so both share one cache entry.
+        """
+        if self.response_cache_dir is None:
+            return None
+
+        digest = hashlib.sha256()
+        digest.update(self.model.encode("utf-8"))
+        digest.update(b"\0")
+        if cached_content:
+            digest.update(
+                self._construct_static_prompt(RESUME_LATEX_TEMPLATE).encode("utf-8")
+            )
+        digest.update(prompt.encode("utf-8"))
+        return digest.hexdigest()
+
+    def _read_cached_response(self, cache_key: Optional[str]) -> Optional[str]:
+        """Return the cached response for a prompt hash, if there is one."""
+        if cache_key is None:
+            return None
+        cache_file = self.response_cache_dir / f"{cache_key}.txt"
+        try:
+            text = cache_file.read_bytes().decode("utf-8")
+        except OSError:
+            return None
+        self._remember_response_key(cache_key, text)
+        return text
+
+    def _write_cached_response(self, cache_key: Optional[str], text: str) -> None:
+        """Store a response under its prompt hash; empty responses are not cached."""
+        if cache_key is None or not text:
+            return
+        # Write to a temporary name first so readers never see a partial file
+        cache_file = self.response_cache_dir / f"{cache_key}.txt"
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            tmp_file.write_bytes(text.encode("utf-8"))
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            return
+        self._remember_response_key(cache_key, text)
+
+    def _remember_response_key(self, cache_key: str, text: str) -> None:
+        """Record that ``text`` is stored under ``cache_key``."""
+        digest = self._response_digest(self._clean_latex_response(text))
+        with self._response_keys_lock:
+            self._response_keys.setdefault(digest, set()).add(cache_key)
+
+    def evict_cached_response(self, latex_code: str) -> None:
+        """
+        Remove the cached response(s) this generator returned as ``latex_code``.
+
+        Call this when the LaTeX fails to compile, so re-running the request
+        asks Gemini again instead of replaying the same broken output.
+
+        Args:
+            latex_code: LaTeX code returned by one of the generate methods
+        """
+        if self.response_cache_dir is None:
+            return
+
+        with self._response_keys_lock:
+            cache_keys = self._response_keys.pop(
+                self._response_digest(latex_code.strip()), set()
+            )
+        for cache_key in cache_keys:
+            try:
+                (self.response_cache_dir / f"{cache_key}.txt").unlink()
+            except OSError:
+                pass
+
+    @staticmethod
+    def _response_digest(text: str) -> str:
+        """Hash identifying a cleaned response."""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _generation_config(cached_content: Optional[str] = None) -> dict:
+        """Return the generation config, referencing the prompt cache if given."""
+        if cached_content:
+            return {**GENERATION_CONFIG, "cached_content": cached_content}
+        return GENERATION_CONFIG
+
+    def _construct_prompt(
+        self,
+        current_resume: str,
+        job_description: str,
+        template: str,
+        custom_instructions: Optional[str] = None,
+    ) -> str:
+        """Construct the full prompt for the LLM."""
+        return "".join(
+            (
+                self._construct_static_prompt(template),
+                *self._request_prompt_parts(
+                    current_resume, job_description, custom_instructions
+                ),
+            )
+        )
+
+    def _construct_static_prompt(self, template: str) -> str:
+        """Construct the part of the prompt that is the same for every request."""
+        return _build_static_prompt(template)
+
+    def _construct_request_prompt(
+        self,
+        current_resume: str,
+        job_description: str,
+        custom_instructions: Optional[str] = None,
+    ) -> str:
+        """Construct the per-request part of the prompt."""
+        return "".join(
+            self._request_prompt_parts(
+                current_resume, job_description, custom_instructions
+            )
+        )
+
+    @staticmethod
+    def _request_prompt_parts(
+        current_resume: str,
+        job_description: str,
+        custom_instructions: Optional[str] = None,
+        tail: str = PROMPT_TAIL,
+    ) -> tuple:
+        """
+        Return the per-request prompt as pieces to be joined in one pass.
+
+        The framing text is precomputed; only the user inputs vary.
+        """
+        if custom_instructions:
+            return (
+                PROMPT_INSTRUCTIONS_HEADER,
+                custom_instructions,
+                PROMPT_RESUME_HEADER_AFTER_INSTRUCTIONS,
+                current_resume,
+                PROMPT_JOB_HEADER,
+                job_description,
+                tail,
+            )
+        return (
+            PROMPT_RESUME_HEADER,
+            current_resume,
+            PROMPT_JOB_HEADER,
+            job_description,
+            tail,
+        )
 
     def _clean_latex_response(self, response: str) -> str:
         """
@@ -110,24 +856,13 @@ Now generate the complete LaTeX code for the customized resume. Output ONLY the
 
         Removes markdown code blocks and any surrounding text.
         """
-        # Remove markdown code block syntax if present
-        if "```latex" in response:
-            # Extract content between ```latex and ```
-            start = response.find("```latex") + 8
-            end = response.find("```", start)
-            if end != -1:
-                response = response[start:end]
-        elif "```" in response:
-            # Extract content between ``` and ```
-            start = response.find("```") + 3
-            end = response.find("```", start)
-            if end != -1:
-                response = response[start:end]
-
-        # Strip whitespace
-        response = response.strip()
-
-        return response
+        # Keep only the body of the first markdown code block, if any; an
+        # unterminated block (e.g. a truncated response) runs to the end
+        match = CODE_FENCE_PATTERN.search(response)
+        if match:
+            response = match.group(1)
+
+        return response.strip()
 
     def _validate_and_enhance_latex(self, latex_code: str, template: str) -> str:
         """
@@ -143,90 +878,22 @@ Now generate the complete LaTeX code for the customized resume. Output ONLY the
         validation_prompt = self._construct_validation_prompt(latex_code, template)
 
         try:
-            response = self.client.models.generate_content(
-                model=self.model, contents=validation_prompt
-            )
-
-            enhanced_latex = response.text
+            enhanced_latex = self._generate_text(validation_prompt)
             enhanced_latex = self._clean_latex_response(enhanced_latex)
 
             return enhanced_latex
 
         except Exception as e:
             # If validation fails, return original code
-            print(f"⚠️  Validation pass failed, using original output: {str(e)}")
+            logger.warning(
+                f"⚠️  Validation pass failed, using original output: {str(e)}"
+            )
             return latex_code
 
     def _construct_validation_prompt(self, latex_code: str, template: str) -> str:
         """Construct the validation prompt for the second LLM pass."""
-        prompt = rf"""You are a LaTeX expert and resume quality reviewer. Your task is to review and enhance the generated LaTeX resume code.
-
-ORIGINAL TEMPLATE FOR REFERENCE:
-{template}
-
----
-
-GENERATED LATEX CODE TO REVIEW:
-{latex_code}
-
----
-
-YOUR TASK:
-Review the generated LaTeX code and fix any issues. Then output the CORRECTED and ENHANCED version.
-
-CHECK FOR THESE ISSUES:
-
-1. **LaTeX SYNTAX ERRORS:**
-   - Missing or mismatched braces {{}}
-   - Incorrect command usage (\\resumeSubheading, \\resumeItem, etc.)
-   - Special characters that need escaping (%, &, $, #, _, {{, }})
-   - Malformed URLs or email addresses
-   - Missing required arguments in commands
-
-2. **TEMPLATE COMPLIANCE:**
-   - Ensure ALL commands match the template exactly
-   - No extra packages or modifications to template structure
-   - Correct usage of \\resumeSubheading, \\resumeProjectHeading, etc.
-   - Proper nesting of \\resumeItemListStart and \\resumeItemListEnd
-
-3. **ONE-PAGE CONSTRAINT:**
-   - If content seems too long, condense bullet points
-   - Remove less impactful items
-   - Ensure it will fit on ONE PAGE when compiled
-
-4. **FORMATTING ISSUES:**
-   - Consistent spacing and indentation
-   - Proper date formats
-   - Correct use of emphasis (\\textbf, \\emph)
-   - No orphaned or incomplete sections
-
-5. **CONTENT QUALITY:**
-   - Bullet points are concise (1-2 lines max)
-   - Action verbs used effectively
-   - Metrics included where present
-   - No placeholder text like "ABC Company" or "Your Name"
-   - Professional language throughout
-
-6. **SPECIAL CHARACTER ESCAPING:**
-   - Escape: % \# $ & _ {{ }}
-   - Use \\& for ampersands
-   - Use \\% for percentages
-   - Use \\$ for dollar signs
-   - Use \\# for hashtags
-
-CRITICAL RULES:
-✅ Fix all LaTeX syntax errors
-✅ Ensure template structure is followed exactly
-✅ Maintain one-page length
-✅ Improve clarity and impact
-✅ Return ONLY the complete, corrected LaTeX code
-❌ Do NOT add explanations or comments
-❌ Do NOT modify the template structure itself
-❌ Do NOT add new packages
-
-Output the COMPLETE corrected LaTeX document, ready to compile without errors.
-"""
-        return prompt
+        head, tail = _build_validation_framing(template)
+        return "".join((head, latex_code, tail))
 
     def generate_with_custom_instructions(
         self,
@@ -234,7 +901,7 @@ Output the COMPLETE corrected LaTeX document, ready to compile without errors.
         job_description: str,
         custom_instructions: str,
         template: Optional[str] = None,
-        two_pass: bool = True,
+        two_pass: bool = False,
     ) -> str:
         """
         Generate a customized resume with custom instructions.
@@ -244,7 +911,9 @@ Output the COMPLETE corrected LaTeX document, ready to compile without errors.
             job_description: The target job description
             custom_instructions: Additional custom instructions for the LLM
             template: LaTeX template to use
-            two_pass: If True, uses two-pass generation (generate + validate/enhance)
+            two_pass: If True, runs a second validation/enhancement call. The
+                review checklist is already part of the first prompt, so this is
+                off by default.
 
         Returns:
             str: Generated LaTeX code
@@ -252,47 +921,145 @@ Output the COMPLETE corrected LaTeX document, ready to compile without errors.
         if template is None:
             template = RESUME_LATEX_TEMPLATE
 
-        base_instructions = get_template_instructions()
-        full_instructions = (
-            f"{base_instructions}\n\nADDITIONAL INSTRUCTIONS:\n{custom_instructions}"
-        )
-
-        prompt = f"""{full_instructions}
+        try:
+            latex_code = "".join(
+                self._stream_resume(
+                    current_resume, job_description, template, custom_instructions
+                )
+            )
+            latex_code = self._clean_latex_response(latex_code)
 
----
+            # Second pass: Validate and enhance if requested
+            if two_pass:
+                logger.info("   🔍 Pass 2/2: Validating and enhancing LaTeX code...")
+                latex_code = self._validate_and_enhance_latex(latex_code, template)
 
-CURRENT RESUME:
-{current_resume}
+            return latex_code
 
----
+        except Exception as e:
+            raise Exception(f"Error generating resume with Gemini API: {str(e)}")
 
-JOB DESCRIPTION:
-{job_description}
+    def generate_batch(
+        self,
+        jobs: List[Tuple[str, str]],
+        custom_instructions: Optional[str] = None,
+        template: Optional[str] = None,
+        poll_interval: float = 10.0,
+        max_poll_interval: float = 300.0,
+        timeout: Optional[float] = None,
+    ) -> List[Optional[str]]:
+        """
+        Generate customized resumes for many jobs with the Gemini Batch API.
 
----
+        Batch requests are billed at a reduced rate and are not subject to the
+        interactive rate limits, but they complete asynchronously; this method
+        blocks and polls until the batch job finishes.
 
-LATEX TEMPLATE TO USE:
-{template}
-
----
+        Args:
+            jobs: List of (current_resume, job_description) text pairs
+            custom_instructions: Additional custom instructions applied to every job
+            template: LaTeX template to use (defaults to built-in template)
+            poll_interval: Initial delay in seconds between status checks
+            max_poll_interval: Upper bound for the exponential polling backoff
+            timeout: Give up after this many seconds (None waits indefinitely)
 
-Now generate the complete LaTeX code for the customized resume. Output ONLY the LaTeX code, nothing else.
-"""
+        Returns:
+            list: Generated LaTeX code for each job, in input order. Entries are
+            None for requests that failed within an otherwise successful batch.
+        """
+        if template is None:
+            template = RESUME_LATEX_TEMPLATE
 
         try:
-            response = self.client.models.generate_content(
-                model=self.model, contents=prompt
+            with tempfile.NamedTemporaryFile(
+                mode="w", suffix=".jsonl", delete=False, encoding="utf-8"
+            ) as requests_file:
+                for idx, (current_resume, job_description) in enumerate(jobs):
+                    prompt = self._construct_prompt(
+                        current_resume, job_description, template, custom_instructions
+                    )
+                    request = {
+                        "key": str(idx),
+                        "request": {
+                            "contents": [{"role": "user", "parts": [{"text": prompt}]}],
+                            "generation_config": GENERATION_CONFIG,
+                        },
+                    }
+                    requests_file.write(json.dumps(request) + "\n")
+                requests_path = requests_file.name
+
+            try:
+                uploaded = self.client.files.upload(
+                    file=requests_path, config={"mime_type": "jsonl"}
+                )
+            finally:
+                os.unlink(requests_path)
+
+            batch_job = self.client.batches.create(model=self.model, src=uploaded.name)
+            batch_job = self._wait_for_batch(
+                batch_job.name, poll_interval, max_poll_interval, timeout
             )
 
-            latex_code = response.text
-            latex_code = self._clean_latex_response(latex_code)
-
-            # Second pass: Validate and enhance if requested
-            if two_pass:
-                print("   🔍 Pass 2/2: Validating and enhancing LaTeX code...")
-                latex_code = self._validate_and_enhance_latex(latex_code, template)
+            if batch_job.state.name != "JOB_STATE_SUCCEEDED":
+                raise Exception(f"Batch job ended in state {batch_job.state.name}")
 
-            return latex_code
+            output = self.client.files.download(file=batch_job.dest.file_name)
+            return self._parse_batch_output(output.decode("utf-8"), len(jobs))
 
         except Exception as e:
-            raise Exception(f"Error generating resume with Gemini API: {str(e)}")
+            raise Exception(f"Error generating resumes with Gemini Batch API: {str(e)}")
+
+    def _wait_for_batch(
+        self,
+        name: str,
+        poll_interval: float,
+        max_poll_interval: float,
+        timeout: Optional[float],
+    ):
+        """Poll a batch job with exponential backoff until it reaches a final state."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delay = poll_interval
+
+        while True:
+            batch_job = self.client.batches.get(name=name)
+            if batch_job.state.name in BATCH_DONE_STATES:
+                return batch_job
+
+            if deadline is not None and time.monotonic() + delay > deadline:
+                raise Exception(f"Batch job {name} did not finish within {timeout}s")
+
+            time.sleep(delay)
+            delay = min(delay * 2, max_poll_interval)
+
+    def _parse_batch_output(self, output: str, count: int) -> List[Optional[str]]:
+        """Map the JSONL output of a batch job back to LaTeX code by request key."""
+        results: List[Optional[str]] = [None] * count
+
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+
+            entry = json.loads(line)
+            idx = int(entry["key"])
+
+            if "error" in entry:
+                logger.warning(f"⚠️  Batch request {idx} failed: {entry['error']}")
+                continue
+
+            # A blocked prompt has no candidates, and a candidate stopped by a
+            # safety filter has no content; only that request fails
+            response = entry.get("response") or {}
+            candidates = response.get("candidates") or []
+            content = candidates[0].get("content") if candidates else None
+            if not content:
+                reason = response.get("promptFeedback") or (
+                    candidates[0].get("finishReason") if candidates else None
+                )
+                logger.warning(f"⚠️  Batch request {idx} returned no content: {reason}")
+                continue
+
+            parts = content.get("parts") or []
+            text = "".join(part.get("text", "") for part in parts)
+            results[idx] = self._clean_latex_response(text)
+
+        return results
@@ -1,19 +1,66 @@
 """LaTeX to PDF/Word converter."""
 
+import atexit
+import functools
+import hashlib
+import itertools
+import mmap
 import os
+import re
+import shutil
 import subprocess
 import tempfile
+import threading
 from pathlib import Path
 from typing import Literal, Optional
 import pypandoc
 
+# Commands whose output depends on the .aux file of a previous pdflatex run,
+# including the hyperref (\autoref, \nameref), cleveref (\cref, \Cref),
+# varioref and natbib/biblatex (\citep, \parencite, ...) variants
+CROSS_REFERENCE_PATTERN = re.compile(
+    r"\\(?:tableofcontents|listoffigures|listoftables|label"
+    r"|(?:page|eq|auto|name|c|C|cpage|Cpage|v|V)?ref"
+    r"|(?:paren|text|auto|foot|super|full|no)?[Cc]ite[a-zA-Z]*)(?![a-zA-Z])"
+)
+
+# Log messages asking for another pdflatex pass to fix visible references.
+# hyperref's "Rerun to get outlines right" is deliberately absent: it only
+# concerns PDF bookmarks and shows up on every fresh build of the template.
+LOG_RERUN_MARKERS = (
+    b"Rerun to get cross-references right",
+    b"Label(s) may have changed",
+)
+
+# Compile timeouts in seconds; Tectonic may download packages on first use
+PDFLATEX_TIMEOUT = 30
+TECTONIC_TIMEOUT = 120
+
+# Everything before \begin{document}, which is dumped into a format file
+PREAMBLE_PATTERN = re.compile(r"\A(.*?)\\begin\{document\}", re.DOTALL)
+
+# Precompiled preamble formats, kept across runs
+FORMAT_CACHE_DIR = Path.home() / ".cache" / "resume_customizer" / "formats"
+
+# Error lines in a pdflatex log start with "!"
+LOG_ERROR_PATTERN = re.compile(rb"^!.*$", re.MULTILINE)
+
 
 class LaTeXConverter:
     """Converter for LaTeX documents to PDF and Word formats."""
 
     def __init__(self):
         """Initialize the converter."""
-        self.temp_dir = None
+        # Compile directory shared by every PDF build of this process
+        self.temp_dir: Optional[Path] = None
+        self._temp_dir_pid: Optional[int] = None
+        self._temp_dir_lock = threading.Lock()
+        self._job_ids = itertools.count()
+
+        # Preamble hash -> precompiled format name (None if it can't be used)
+        self.format_cache_dir = FORMAT_CACHE_DIR
+        self._formats: dict = {}
+        self._format_lock = threading.Lock()
 
     def convert(
         self,
@@ -53,7 +100,7 @@ class LaTeXConverter:
         self, latex_code: str, output_path: Path, cleanup: bool = True
     ) -> str:
         """
-        Convert LaTeX to PDF using pdflatex.
+        Convert LaTeX to PDF using Tectonic if installed, otherwise pdflatex.
 
         Args:
             latex_code: LaTeX source code
@@ -63,68 +110,320 @@ class LaTeXConverter:
         Returns:
             str: Path to generated PDF
         """
-        # Create temporary directory for compilation
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            tex_file = temp_path / "resume.tex"
+        # Each build gets its own job name so concurrent builds in the shared
+        # compile directory don't clobber each other's aux files
+        temp_path = self._get_temp_dir()
+        job_name = f"resume-{next(self._job_ids)}"
+        tex_file = temp_path / f"{job_name}.tex"
+
+        try:
+            # Write LaTeX code to file, encoded once with no newline translation
+            _write_file(tex_file, latex_code.encode("utf-8"))
+
+            # Prefer Tectonic: it reruns only as often as needed and keeps a
+            # persistent package cache between invocations
+            if shutil.which("tectonic"):
+                timeout = TECTONIC_TIMEOUT
+                self._run_tectonic(tex_file, temp_path)
+            else:
+                timeout = PDFLATEX_TIMEOUT
+                self._run_pdflatex(latex_code, tex_file, temp_path)
+
+            # Check if compilation was successful
+            pdf_file = temp_path / f"{job_name}.pdf"
+            if not pdf_file.exists():
+                # Try to extract error from log
+                log_file = temp_path / f"{job_name}.log"
+                error_line = self._first_log_error(log_file)
+                if error_line:
+                    raise Exception(f"LaTeX Error: {error_line}")
+                raise Exception("PDF compilation failed")
+
+            # Move PDF to output location (a rename on the same filesystem)
+            try:
+                os.replace(pdf_file, output_path)
+            except OSError:
+                shutil.copy(pdf_file, output_path)
+
+            return str(output_path)
+
+        except subprocess.TimeoutExpired:
+            raise Exception(f"PDF compilation timed out after {timeout} seconds")
+        except FileNotFoundError:
+            raise Exception(
+                "pdflatex not found. Please install LaTeX (e.g., TeX Live, MiKTeX) "
+                "or Tectonic to enable PDF generation."
+            )
+        except Exception as e:
+            raise Exception(f"Error converting LaTeX to PDF: {str(e)}")
+        finally:
+            if cleanup:
+                self._remove_job_files(temp_path, job_name)
 
-            # Write LaTeX code to file
-            with open(tex_file, "w", encoding="utf-8") as f:
-                f.write(latex_code)
+    def _run_pdflatex(self, latex_code: str, tex_file: Path, temp_path: Path) -> None:
+        """
+        Compile ``tex_file`` with pdflatex into ``temp_path``.
 
+        The preamble is loaded from a precompiled format file when one can be
+        built. Formats are kept in ``format_cache_dir``, so a preamble's
+        packages are parsed once rather than on every build.
+        """
+        # A second pass is only needed to resolve cross-references;
+        # the first of two passes runs in draft mode (no PDF output)
+        passes = [[]]
+        if self._needs_second_pass(latex_code):
+            passes = [["-draftmode"], []]
+
+        format_name = self._get_preamble_format(latex_code, temp_path)
+        self._compile_passes(
+            tex_file, temp_path, passes, format_name, self.format_cache_dir
+        )
+
+        if format_name is None:
+            return
+
+        pdf_file = temp_path / f"{tex_file.stem}.pdf"
+        ok_marker = self.format_cache_dir / f"{format_name}.ok"
+        if pdf_file.exists():
             try:
-                # Run pdflatex twice (for references and TOC if any)
-                for _ in range(2):
-                    result = subprocess.run(
-                        [
-                            "pdflatex",
-                            "-interaction=nonstopmode",
-                            "-output-directory",
-                            str(temp_path),
-                            str(tex_file),
-                        ],
-                        capture_output=True,
-                        text=True,
-                        timeout=30,
-                    )
-
-                    # Check if compilation was successful
-                    pdf_file = temp_path / "resume.pdf"
-                    if not pdf_file.exists():
-                        # Try to extract error from log
-                        log_file = temp_path / "resume.log"
-                        error_msg = "PDF compilation failed"
-                        if log_file.exists():
-                            with open(
-                                log_file, "r", encoding="utf-8", errors="ignore"
-                            ) as f:
-                                log_content = f.read()
-                                # Extract error lines
-                                error_lines = [
-                                    line
-                                    for line in log_content.split("\n")
-                                    if "!" in line
-                                ]
-                                if error_lines:
-                                    error_msg = f"LaTeX Error: {error_lines[0]}"
-                        raise Exception(error_msg)
-
-                # Copy PDF to output location
-                import shutil
+                ok_marker.touch()
+            except OSError:
+                pass
+            return
+
+        # A format that has compiled a document before isn't the problem;
+        # the document itself doesn't compile
+        if ok_marker.exists():
+            return
+
+        # Some packages misbehave when loaded from a dumped format. Retry
+        # the regular way, and if that works stop using the format.
+        self._compile_passes(tex_file, temp_path, passes, None)
+        if pdf_file.exists():
+            self._disable_format(format_name)
 
-                shutil.copy(pdf_file, output_path)
+    @staticmethod
+    def _compile_passes(
+        tex_file: Path,
+        temp_path: Path,
+        passes: list,
+        format_name: Optional[str],
+        format_dir: Optional[Path] = None,
+    ) -> None:
+        """Run the given pdflatex passes, optionally with a precompiled format."""
+        format_args = []
+        env = None
+        if format_name:
+            format_args = [f"-fmt={format_name}"]
+            # Search format_dir first, then the default locations (an empty
+            # path element expands to the default search path)
+            search_path = os.environ.get("TEXFORMATS", "")
+            env = {**os.environ, "TEXFORMATS": f"{format_dir}{os.pathsep}{search_path}"}
+
+        def run_pass(extra_args: list) -> None:
+            subprocess.run(
+                [
+                    "pdflatex",
+                    "-interaction=nonstopmode",
+                    "-no-shell-escape",
+                    *format_args,
+                    *extra_args,
+                    "-output-directory",
+                    str(temp_path),
+                    str(tex_file),
+                ],
+                # Keeps stray files (e.g. missfont.log) in the compile directory
+                cwd=temp_path,
+                env=env,
+                stdin=subprocess.DEVNULL,
+                capture_output=True,
+                timeout=PDFLATEX_TIMEOUT,
+            )
 
-                return str(output_path)
+        for extra_args in passes:
+            run_pass(extra_args)
 
-            except subprocess.TimeoutExpired:
-                raise Exception("PDF compilation timed out after 30 seconds")
-            except FileNotFoundError:
-                raise Exception(
-                    "pdflatex not found. Please install LaTeX (e.g., TeX Live, MiKTeX) "
-                    "to enable PDF generation."
+        # References the source scan missed (e.g. from a package) show up
+        # as a rerun request in the log; honor it once
+        log_file = temp_path / f"{tex_file.stem}.log"
+        try:
+            log = log_file.read_bytes()
+        except OSError:
+            log = b""
+        rerun = any(marker in log for marker in LOG_RERUN_MARKERS)
+        if rerun:
+            run_pass([])
+
+    def _get_preamble_format(self, latex_code: str, temp_path: Path) -> Optional[str]:
+        """
+        Return the name of the precompiled format for the document's preamble.
+
+        The format is dumped with mylatexformat on first use and reused by
+        every later build with the same preamble and pdflatex binary, in this
+        and later processes. Returns None when the document has no preamble or
+        its format can't be dumped or was found not to work.
+        """
+        match = PREAMBLE_PATTERN.search(latex_code)
+        if match is None:
+            return None
+
+        preamble = match.group(1)
+        fingerprint = _pdflatex_fingerprint()
+        if fingerprint is None:
+            return None
+        preamble_key = hashlib.sha256(
+            f"{fingerprint}\0{preamble}".encode("utf-8")
+        ).hexdigest()[:16]
+
+        # Concurrent builds with the same preamble must not all dump it
+        with self._format_lock:
+            if preamble_key not in self._formats:
+                self._formats[preamble_key] = self._load_or_dump_format(
+                    preamble, f"preamble-{preamble_key}", temp_path
                 )
-            except Exception as e:
-                raise Exception(f"Error converting LaTeX to PDF: {str(e)}")
+            return self._formats[preamble_key]
+
+    def _load_or_dump_format(
+        self, preamble: str, format_name: str, temp_path: Path
+    ) -> Optional[str]:
+        """Return ``format_name`` if its format is (or can be made) available."""
+        cache_dir = self.format_cache_dir
+        if (cache_dir / f"{format_name}.disabled").exists():
+            return None
+        if (cache_dir / f"{format_name}.fmt").exists():
+            return format_name
+
+        if not self._dump_format(preamble, format_name, temp_path):
+            # e.g. mylatexformat isn't installed; don't retry in later runs
+            self._mark_format_disabled(format_name)
+            return None
+
+        # Publish atomically; another process may be dumping the same format
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            partial = cache_dir / f"{format_name}.fmt.{os.getpid()}.tmp"
+            shutil.copyfile(temp_path / f"{format_name}.fmt", partial)
+            os.replace(partial, cache_dir / f"{format_name}.fmt")
+        except OSError:
+            return None
+        return format_name
+
+    def _disable_format(self, format_name: str) -> None:
+        """Stop using a format that breaks documents, in this and later runs."""
+        with self._format_lock:
+            for key, name in self._formats.items():
+                if name == format_name:
+                    self._formats[key] = None
+
+        self._mark_format_disabled(format_name)
+        try:
+            (self.format_cache_dir / f"{format_name}.fmt").unlink()
+        except OSError:
+            pass
+
+    def _mark_format_disabled(self, format_name: str) -> None:
+        """Record on disk that ``format_name`` must not be used."""
+        try:
+            self.format_cache_dir.mkdir(parents=True, exist_ok=True)
+            (self.format_cache_dir / f"{format_name}.disabled").touch()
+        except OSError:
+            pass
+
+    @staticmethod
+    def _dump_format(preamble: str, format_name: str, temp_path: Path) -> bool:
+        """Precompile ``preamble`` into ``temp_path/<format_name>.fmt``."""
+        preamble_file = temp_path / f"{format_name}.tex"
+        preamble_file.write_bytes(
+            f"{preamble}\\begin{{document}}\\end{{document}}\n".encode("utf-8")
+        )
+
+        try:
+            subprocess.run(
+                [
+                    "pdflatex",
+                    "-ini",
+                    "-interaction=nonstopmode",
+                    "-no-shell-escape",
+                    f"-jobname={format_name}",
+                    "&pdflatex",
+                    "mylatexformat.ltx",
+                    preamble_file.name,
+                ],
+                cwd=temp_path,
+                stdin=subprocess.DEVNULL,
+                capture_output=True,
+                timeout=PDFLATEX_TIMEOUT,
+            )
+        except subprocess.TimeoutExpired:
+            return False
+
+        return (temp_path / f"{format_name}.fmt").exists()
+
+    @staticmethod
+    def _run_tectonic(tex_file: Path, temp_path: Path) -> None:
+        """Compile ``tex_file`` with Tectonic into ``temp_path``."""
+        subprocess.run(
+            [
+                "tectonic",
+                "-X",
+                "compile",
+                "--untrusted",
+                "--keep-logs",
+                "--outdir",
+                str(temp_path),
+                str(tex_file),
+            ],
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            timeout=TECTONIC_TIMEOUT,
+        )
+
+    def _get_temp_dir(self) -> Path:
+        """Return this process's compile directory, creating it on first use."""
+        # Concurrent first builds (thread pools) must agree on one directory
+        with self._temp_dir_lock:
+            # A forked worker must not share its parent's directory
+            if self.temp_dir is None or self._temp_dir_pid != os.getpid():
+                self.temp_dir = Path(tempfile.mkdtemp(prefix="resumecust-"))
+                self._temp_dir_pid = os.getpid()
+                atexit.register(shutil.rmtree, self.temp_dir, ignore_errors=True)
+            return self.temp_dir
+
+    @staticmethod
+    def _remove_job_files(temp_path: Path, job_name: str) -> None:
+        """Delete the .tex/.aux/.log/... files left behind by one build."""
+        prefix = f"{job_name}."
+        for name in os.listdir(temp_path):
+            if name.startswith(prefix):
+                try:
+                    os.unlink(temp_path / name)
+                except OSError:
+                    pass
+
+    @staticmethod
+    def _first_log_error(log_file: Path) -> Optional[str]:
+        """
+        Return the first error line ("! ...") of a pdflatex log, if any.
+
+        The log is memory-mapped and searched with a single regex scan, which
+        stops at the first match even for very long runaway logs.
+        """
+        try:
+            with open(log_file, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return None
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as log:
+                    match = LOG_ERROR_PATTERN.search(log)
+                    if match is None:
+                        return None
+                    return match.group(0).decode("utf-8", "ignore").rstrip("\r")
+        except OSError:
+            return None
+
+    @staticmethod
+    def _needs_second_pass(latex_code: str) -> bool:
+        """Check whether the document uses cross-references that need a rerun."""
+        return CROSS_REFERENCE_PATTERN.search(latex_code) is not None
 
     def _latex_to_docx(
         self, latex_code: str, output_path: Path, cleanup: bool = True
@@ -143,9 +442,9 @@ class LaTeXConverter:
         try:
             # Create temporary LaTeX file
             with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".tex", delete=False, encoding="utf-8"
+                mode="wb", suffix=".tex", delete=False
             ) as temp_file:
-                temp_file.write(latex_code)
+                temp_file.write(latex_code.encode("utf-8"))
                 temp_tex_path = temp_file.name
 
             try:
@@ -188,8 +487,7 @@ class LaTeXConverter:
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(latex_code)
+        _write_file(output_path, latex_code.encode("utf-8"))
 
         return str(output_path)
 
@@ -198,25 +496,71 @@ class LaTeXConverter:
         """
         Check if required dependencies are installed.
 
+        The probe runs once per process; later calls return the cached result.
+
         Returns:
             dict: Dictionary with dependency status
         """
-        dependencies = {"pdflatex": False, "pandoc": False}
-
-        # Check pdflatex
-        try:
-            result = subprocess.run(
-                ["pdflatex", "--version"], capture_output=True, timeout=5
-            )
-            dependencies["pdflatex"] = result.returncode == 0
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            pass
+        return dict(_probe_dependencies())
 
-        # Check pandoc
-        try:
-            pypandoc.get_pandoc_version()
-            dependencies["pandoc"] = True
-        except Exception:
-            pass
-
-        return dependencies
+    @staticmethod
+    def invalidate_dependency_cache() -> None:
+        """Forget the cached probe, e.g. after installing LaTeX or Pandoc."""
+        _probe_dependencies.cache_clear()
+        _pdflatex_fingerprint.cache_clear()
+
+
+def _write_file(path: Path, data: bytes) -> None:
+    """
+    Write ``data`` to ``path`` with raw os.open/os.write calls.
+
+    Skips Python's buffered file objects; a .tex file is small enough that
+    the first write() almost always takes all of it.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
+@functools.lru_cache(maxsize=1)
+def _pdflatex_fingerprint() -> Optional[str]:
+    """Identify the installed pdflatex binary; formats only load in the same one."""
+    path = shutil.which("pdflatex")
+    if path is None:
+        return None
+    real_path = os.path.realpath(path)
+    stat = os.stat(real_path)
+    return f"{real_path}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+@functools.lru_cache(maxsize=1)
+def _probe_dependencies() -> dict:
+    """Probe for pdflatex, tectonic and pandoc; cached since it spawns subprocesses."""
+    dependencies = {"pdflatex": False, "tectonic": False, "pandoc": False}
+
+    # Check pdflatex
+    try:
+        result = subprocess.run(
+            ["pdflatex", "--version"], capture_output=True, timeout=5
+        )
+        dependencies["pdflatex"] = result.returncode == 0
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        pass
+
+    # Check tectonic
+    dependencies["tectonic"] = shutil.which("tectonic") is not None
+
+    # Check pandoc
+    try:
+        pypandoc.get_pandoc_version()
+        dependencies["pandoc"] = True
+    except Exception:
+        pass
+
+    return dependencies
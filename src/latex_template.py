@@ -1,5 +1,7 @@
 """LaTeX template for resume generation."""
 
+import re
+
 RESUME_LATEX_TEMPLATE = r"""
 %-------------------------
 % Resume in Latex
@@ -221,10 +223,36 @@ RESUME_LATEX_TEMPLATE = r"""
 \end{document}
 """
 
+# LaTeX comments that start a line or follow whitespace. A "%" right after
+# other text (used to swallow the line break) and "\%" are left alone.
+LATEX_COMMENT_PATTERN = re.compile(r"(?:^|(?<=\s))%.*$", re.MULTILINE)
 
-def get_template_instructions():
-    """Get instructions for the LLM on how to fill the template."""
-    return """
+
+def strip_latex_comments(latex: str) -> str:
+    """
+    Remove comments and collapse runs of blank lines in LaTeX source.
+
+    Args:
+        latex: LaTeX source code
+
+    Returns:
+        str: The same source without comments
+    """
+    lines = []
+    for line in LATEX_COMMENT_PATTERN.sub("", latex).splitlines():
+        line = line.rstrip()
+        if line or (lines and lines[-1]):
+            lines.append(line)
+    return "\n".join(lines).strip() + "\n"
+
+
+# The template as sent to the LLM: the comments (credits, commented-out font
+# options and sample entries) only cost tokens, in the prompt and the output
+TEMPLATE_FOR_LLM = strip_latex_comments(RESUME_LATEX_TEMPLATE)
+
+
+# Instructions for the LLM on how to fill the template
+TEMPLATE_INSTRUCTIONS = """
 You are a professional resume writer. You will receive:
 1. A user's current resume content
 2. A job description they're applying for
@@ -345,3 +373,13 @@ NOT: "What can I remove to fit the page limit?"
 
 Output ONLY the complete LaTeX code ready to be compiled. Follow the template EXACTLY.
 """
+
+
+def get_template_instructions():
+    """Get instructions for the LLM on how to fill the template."""
+    return TEMPLATE_INSTRUCTIONS
+
+
+def get_template_for_llm():
+    """Get the built-in template without comments, for use in prompts."""
+    return TEMPLATE_FOR_LLM
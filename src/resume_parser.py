@@ -1,11 +1,26 @@
 """Resume parser for different file formats."""
 
 import os
+import threading
+import zipfile
+from collections import OrderedDict
 from pathlib import Path
-from typing import Union
-import docx
+from typing import Iterator, List, Union
+from xml.etree import ElementTree
 import fitz  # PyMuPDF
 
+# WordprocessingML namespace used in word/document.xml
+WORD_NAMESPACE = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+# mc:AlternateContent repeats text boxes in mc:Fallback for older readers
+MC_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+
+# Number of parsed files kept in memory, keyed by path, mtime and size
+PARSE_CACHE_SIZE = 8
+
+_parse_cache: "OrderedDict[tuple, str]" = OrderedDict()
+_parse_cache_lock = threading.Lock()
+
 
 class ResumeParser:
     """Parser for extracting text content from resume files."""
@@ -17,6 +32,9 @@ class ResumeParser:
         """
         Parse a resume file and extract text content.
 
+        Results are cached while the file's modification time and size stay
+        the same, so tailoring one resume to many jobs parses it only once.
+
         Args:
             file_path: Path to the resume file
 
@@ -40,15 +58,29 @@ class ResumeParser:
                 f"Supported formats: {', '.join(ResumeParser.SUPPORTED_FORMATS)}"
             )
 
+        stat = file_path.stat()
+        cache_key = (str(file_path.resolve()), stat.st_mtime_ns, stat.st_size)
+        with _parse_cache_lock:
+            if cache_key in _parse_cache:
+                _parse_cache.move_to_end(cache_key)
+                return _parse_cache[cache_key]
+
         if file_ext == ".txt":
-            return ResumeParser._parse_txt(file_path)
+            text = ResumeParser._parse_txt(file_path)
         elif file_ext == ".pdf":
-            return ResumeParser._parse_pdf(file_path)
+            text = ResumeParser._parse_pdf(file_path)
         elif file_ext in [".docx", ".doc"]:
-            return ResumeParser._parse_docx(file_path)
+            text = ResumeParser._parse_docx(file_path)
         else:
             raise ValueError(f"Unsupported format: {file_ext}")
 
+        with _parse_cache_lock:
+            _parse_cache[cache_key] = text
+            while len(_parse_cache) > PARSE_CACHE_SIZE:
+                _parse_cache.popitem(last=False)
+
+        return text
+
     @staticmethod
     def _parse_txt(file_path: Path) -> str:
         """Parse a text file."""
@@ -59,27 +91,73 @@ class ResumeParser:
     def _parse_pdf(file_path: Path) -> str:
         """Parse a PDF file using PyMuPDF."""
         try:
-            doc = fitz.open(file_path)
-            text = []
-            for page in doc:
-                text.append(page.get_text())
-            doc.close()
-            return "\n".join(text)
+            with fitz.open(file_path) as doc:
+                return "\n".join(page.get_text() for page in doc)
         except Exception as e:
             raise Exception(f"Error parsing PDF file: {str(e)}")
 
     @staticmethod
     def _parse_docx(file_path: Path) -> str:
-        """Parse a DOCX file."""
+        """
+        Parse a DOCX file.
+
+        Reads the paragraph text straight from word/document.xml instead of
+        building python-docx's full object model, which we don't need.
+        """
         try:
-            doc = docx.Document(file_path)
-            text = []
-            for paragraph in doc.paragraphs:
-                text.append(paragraph.text)
-            return "\n".join(text)
+            with zipfile.ZipFile(file_path) as archive:
+                with archive.open("word/document.xml") as document_xml:
+                    tree = ElementTree.parse(document_xml)
+
+            return "\n".join(ResumeParser._iter_docx_paragraphs(tree.getroot()))
         except Exception as e:
             raise Exception(f"Error parsing DOCX file: {str(e)}")
 
+    @staticmethod
+    def _iter_docx_paragraphs(element: ElementTree.Element) -> Iterator[str]:
+        """
+        Yield the text of every w:p at or below ``element``, once each.
+
+        Paragraphs inside a paragraph (text boxes) follow the paragraph that
+        anchors them, and mc:Fallback copies are skipped.
+        """
+        if element.tag == MC_FALLBACK:
+            return
+
+        if element.tag != f"{WORD_NAMESPACE}p":
+            for child in element:
+                yield from ResumeParser._iter_docx_paragraphs(child)
+            return
+
+        nested: List[ElementTree.Element] = []
+        yield "".join(ResumeParser._iter_docx_text(element, nested))
+        for inner in nested:
+            yield from ResumeParser._iter_docx_paragraphs(inner)
+
+    @staticmethod
+    def _iter_docx_text(
+        element: ElementTree.Element, nested: List[ElementTree.Element]
+    ) -> Iterator[str]:
+        """
+        Yield the text pieces of a w:p element, mapping tabs and breaks.
+
+        Nested paragraphs and text box contents are not descended into but
+        collected in ``nested``.
+        """
+        for node in element:
+            if node.tag in (f"{WORD_NAMESPACE}p", f"{WORD_NAMESPACE}txbxContent"):
+                nested.append(node)
+            elif node.tag == MC_FALLBACK:
+                continue
+            elif node.tag == f"{WORD_NAMESPACE}t":
+                yield node.text or ""
+            elif node.tag == f"{WORD_NAMESPACE}tab":
+                yield "\t"
+            elif node.tag in (f"{WORD_NAMESPACE}br", f"{WORD_NAMESPACE}cr"):
+                yield "\n"
+            else:
+                yield from ResumeParser._iter_docx_text(node, nested)
+
     @staticmethod
     def parse_job_description(job_desc: Union[str, Path]) -> str:
         """
@@ -117,3 +195,23 @@ class ResumeParser:
             return False
 
         return True
+
+    @staticmethod
+    def validate_job_description(job_desc_text: str) -> bool:
+        """
+        Validate that a job description has enough content to tailor against.
+
+        Args:
+            job_desc_text: Job description text content
+
+        Returns:
+            bool: True if valid, False otherwise
+        """
+        if not job_desc_text or not job_desc_text.strip():
+            return False
+
+        # Check minimum length (at least 50 characters)
+        if len(job_desc_text.strip()) < 50:
+            return False
+
+        return True
@@ -0,0 +1,279 @@
+"""Semantic-similarity cache for generated resumes."""
+
+import functools
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional, Union
+
+# Sentence embedding model used for similarity lookups
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+
+# int8-quantized ONNX export of the model (shipped in its Hugging Face repo),
+# used when onnxruntime is installed; several times faster on CPU than fp32
+EMBEDDING_ONNX_FILE = "onnx/model_qint8_avx512_vnni.onnx"
+
+# all-MiniLM-L6-v2 reads at most 256 word pieces; longer texts are embedded
+# in chunks of this many words and the chunk embeddings averaged
+EMBEDDING_CHUNK_WORDS = 150
+
+# Default on-disk location of the cache
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "resume_customizer"
+
+
+@functools.lru_cache(maxsize=None)
+def _load_embedding_model(model_name: str):
+    """
+    Load a sentence-transformers model once per process.
+
+    Uses the int8 ONNX Runtime backend when onnxruntime is installed and
+    the model provides the quantized export, otherwise the default backend.
+    """
+    import importlib.util
+
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        raise ImportError(
+            "sentence-transformers is required for the semantic cache. "
+            "Install it with: pip install 'resume-customizer[semantic-cache]'"
+        )
+
+    if importlib.util.find_spec("onnxruntime") is not None:
+        try:
+            return SentenceTransformer(
+                model_name,
+                backend="onnx",
+                model_kwargs={
+                    "file_name": EMBEDDING_ONNX_FILE,
+                    "provider": "CPUExecutionProvider",
+                },
+            )
+        except Exception:
+            # Older sentence-transformers or no quantized export available
+            pass
+
+    return SentenceTransformer(model_name)
+
+
+def embed(text: str, model_name: str = EMBEDDING_MODEL):
+    """
+    Embed a text as a unit-length vector.
+
+    Texts longer than the model's input window are split into chunks of
+    EMBEDDING_CHUNK_WORDS words, so the whole text contributes rather than
+    just its beginning.
+
+    Args:
+        text: Text to embed
+        model_name: sentence-transformers model to use
+
+    Returns:
+        numpy.ndarray: Normalized float32 embedding
+    """
+    model = _load_embedding_model(model_name)
+    words = text.split()
+    chunks = [
+        " ".join(words[i : i + EMBEDDING_CHUNK_WORDS])
+        for i in range(0, len(words), EMBEDDING_CHUNK_WORDS)
+    ] or [text]
+    vectors = model.encode(chunks, normalize_embeddings=True)
+    vector = vectors.mean(axis=0)
+    norm = float((vector @ vector) ** 0.5)
+    if norm > 0:
+        vector = vector / norm
+    return vector.astype("float32")
+
+
+def embeddings_available() -> bool:
+    """Check whether sentence-transformers is installed, without importing it."""
+    import importlib.util
+
+    return importlib.util.find_spec("sentence_transformers") is not None
+
+
+def similarity(text_a: str, text_b: str, model_name: str = EMBEDDING_MODEL) -> float:
+    """
+    Cosine similarity of two texts' embeddings.
+
+    Args:
+        text_a: First text
+        text_b: Second text
+        model_name: sentence-transformers model to use
+
+    Returns:
+        float: Similarity in [-1, 1]
+    """
+    return float(embed(text_a, model_name) @ embed(text_b, model_name))
+
+
+class SemanticCache:
+    """
+    Cache of generated LaTeX keyed on the resume and job description.
+
+    The resume must match exactly (by hash), so an edited resume never gets
+    output generated from its old version. The job description is matched by
+    cosine similarity of its embedding, so a near-duplicate (e.g. a reworded
+    job posting) reuses an earlier result instead of calling Gemini again.
+    Entries only match requests with the same variant (custom instructions,
+    two-pass, ...).
+    """
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path] = DEFAULT_CACHE_DIR,
+        threshold: float = 0.92,
+        ttl_seconds: float = 7 * 24 * 3600,
+        model_name: str = EMBEDDING_MODEL,
+    ):
+        """
+        Initialize the cache, loading any entries persisted in ``cache_dir``.
+
+        Args:
+            cache_dir: Directory holding the cache files
+            threshold: Minimum cosine similarity for a hit
+            ttl_seconds: Age after which entries are evicted
+            model_name: sentence-transformers model used for embeddings
+        """
+        import numpy as np
+
+        self._np = np
+        self.cache_dir = Path(cache_dir)
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.model_name = model_name
+        self._lock = threading.Lock()
+
+        self._embeddings_file = self.cache_dir / "sem_cache.npy"
+        self._entries_file = self.cache_dir / "sem_cache.json"
+
+        # Row i of the embedding matrix belongs to entry i
+        self._embeddings = np.empty((0, 0), dtype="float32")
+        self._entries = []
+        self._load()
+
+    @staticmethod
+    def variant_key(
+        custom_instructions: Optional[str] = None, two_pass: bool = False
+    ) -> str:
+        """Return the discriminator that keeps different request variants apart."""
+        raw = f"{int(two_pass)}\0{custom_instructions or ''}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, resume_text: str, job_desc_text: str, variant: str) -> Optional[str]:
+        """
+        Return cached LaTeX for a similar request, if any.
+
+        Args:
+            resume_text: Parsed resume text
+            job_desc_text: Parsed job description text
+            variant: Value of variant_key() for the request
+
+        Returns:
+            Optional[str]: Cached LaTeX code, or None on a miss
+        """
+        resume_hash = self._text_hash(resume_text)
+
+        # Skip embedding the job description when nothing can match
+        with self._lock:
+            if not self._candidates(resume_hash, variant):
+                return None
+
+        query = embed(job_desc_text, self.model_name)
+
+        with self._lock:
+            self._evict_expired()
+            candidates = self._candidates(resume_hash, variant)
+            if not candidates:
+                return None
+
+            # Inner product of unit vectors is their cosine similarity
+            scores = self._embeddings[candidates] @ query
+            best = int(self._np.argmax(scores))
+            if scores[best] >= self.threshold:
+                return self._entries[candidates[best]]["latex"]
+
+        return None
+
+    def put(
+        self, resume_text: str, job_desc_text: str, variant: str, latex_code: str
+    ) -> None:
+        """
+        Store generated LaTeX and persist the cache to disk.
+
+        Args:
+            resume_text: Parsed resume text
+            job_desc_text: Parsed job description text
+            variant: Value of variant_key() for the request
+            latex_code: Generated LaTeX code
+        """
+        vector = embed(job_desc_text, self.model_name)
+
+        with self._lock:
+            self._evict_expired()
+            if self._entries:
+                self._embeddings = self._np.vstack([self._embeddings, vector])
+            else:
+                self._embeddings = vector.reshape(1, -1)
+            self._entries.append(
+                {
+                    "variant": variant,
+                    "resume_hash": self._text_hash(resume_text),
+                    "latex": latex_code,
+                    "created": time.time(),
+                }
+            )
+            self._save()
+
+    def _candidates(self, resume_hash: str, variant: str) -> List[int]:
+        """Indices of entries for the same resume and request variant."""
+        return [
+            idx
+            for idx, entry in enumerate(self._entries)
+            if entry["resume_hash"] == resume_hash and entry["variant"] == variant
+        ]
+
+    @staticmethod
+    def _text_hash(text: str) -> str:
+        """Exact-match key for a text."""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def _evict_expired(self) -> None:
+        """Drop entries older than the TTL."""
+        cutoff = time.time() - self.ttl_seconds
+        keep = [i for i, e in enumerate(self._entries) if e["created"] >= cutoff]
+        if len(keep) != len(self._entries):
+            self._entries = [self._entries[i] for i in keep]
+            self._embeddings = self._embeddings[keep]
+
+    def _load(self) -> None:
+        """Load persisted entries; a missing or unreadable cache starts empty."""
+        try:
+            with open(self._entries_file, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+            embeddings = self._np.load(self._embeddings_file)
+        except (OSError, ValueError):
+            return
+
+        # Entries written before resume hashes were stored can't be matched
+        if len(entries) == len(embeddings) and all(
+            "resume_hash" in entry for entry in entries
+        ):
+            self._entries = entries
+            self._embeddings = embeddings.astype("float32")
+
+    def _save(self) -> None:
+        """Persist the cache, replacing the files atomically."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        tmp_embeddings = self._embeddings_file.with_suffix(".tmp.npy")
+        self._np.save(tmp_embeddings, self._embeddings)
+        tmp_entries = self._entries_file.with_suffix(".tmp")
+        with open(tmp_entries, "w", encoding="utf-8") as f:
+            json.dump(self._entries, f)
+
+        os.replace(tmp_embeddings, self._embeddings_file)
+        os.replace(tmp_entries, self._entries_file)
@@ -2,7 +2,9 @@
 Example script demonstrating how to use the Resume Customizer programmatically.
 """
 
+import logging
 import os
+import sys
 from src.app import ResumeCustomizer, customize_resume_simple
 
 
@@ -16,11 +18,7 @@ def example_basic_usage():
     customizer = ResumeCustomizer()
 
     # Check if API key is set
-    try:
-        if not customizer.gemini_client.api_key:
-            print("⚠️  Please set GEMINI_API_KEY environment variable")
-            return
-    except:
+    if not customizer.has_api_key():
         print("⚠️  Please set GEMINI_API_KEY environment variable")
         return
 
@@ -94,12 +92,12 @@ Responsibilities:
         save_latex=True,
     )
 
-    if result["success"]:
+    if result.success:
         print("\n✅ Resume customized successfully!")
-        print(f"📄 PDF: {result['output_file']}")
-        print(f"📝 LaTeX: {result['latex_file']}")
+        print(f"📄 PDF: {result.output_file}")
+        print(f"📝 LaTeX: {result.latex_file}")
     else:
-        print(f"\n❌ Error: {result['error']}")
+        print(f"\n❌ Error: {result.error}")
 
 
 def example_with_custom_instructions():
@@ -127,9 +125,9 @@ def example_with_custom_instructions():
         save_latex=True,
     )
 
-    if result["success"]:
+    if result.success:
         print("\n✅ Resume with custom instructions generated!")
-        print(f"📄 PDF: {result['output_file']}")
+        print(f"📄 PDF: {result.output_file}")
 
 
 def example_simplified_api():
@@ -145,9 +143,9 @@ def example_simplified_api():
         output_format="pdf",
     )
 
-    if result["success"]:
+    if result.success:
         print("\n✅ Resume generated using simplified API!")
-        print(f"📄 PDF: {result['output_file']}")
+        print(f"📄 PDF: {result.output_file}")
 
 
 def example_generate_latex_only():
@@ -165,9 +163,9 @@ def example_generate_latex_only():
         output_format="tex",
     )
 
-    if result["success"]:
+    if result.success:
         print("\n✅ LaTeX source generated!")
-        print(f"📝 LaTeX: {result['output_file']}")
+        print(f"📝 LaTeX: {result.output_file}")
 
 
 def example_check_requirements():
@@ -228,4 +226,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Show the customizer's progress messages
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     main()